@@ -142,4 +142,4 @@ class Brave(Chrome):
         # have a cardiac arrest on the non-unicode binary data.
         self.cached_key = None
 
-        self.parsed_artifacts.sort()
+        self.parsed_artifacts = self.sorted_history_items(self.parsed_artifacts)
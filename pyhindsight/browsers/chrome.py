@@ -6,6 +6,7 @@ import pathlib
 import sqlite3
 import sys
 import datetime
+import functools
 import re
 import json
 import logging
@@ -13,6 +14,9 @@ import shutil
 import puremagic
 import urllib
 import base64
+import concurrent.futures
+import copy
+import operator
 import pytz
 import ccl_chromium_reader
 
@@ -38,6 +42,418 @@ except ImportError:
 
 log = logging.getLogger(__name__)
 
+# Queries for different versions, keyed by the earliest Chrome version each one applies to. These
+# are defined once here rather than rebuilt on every call to the get_* methods that use them.
+HISTORY_QUERIES = {
+    59: '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
+               urls.hidden, visits.visit_time, visits.from_visit, visits.visit_duration,
+               visits.transition, visit_source.source, visits.id as visit_id
+           FROM urls JOIN visits 
+           ON urls.id = visits.url LEFT JOIN visit_source ON visits.id = visit_source.id''',
+    30: '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
+               urls.hidden, urls.favicon_id, visits.visit_time, visits.from_visit, visits.visit_duration,
+               visits.transition, visit_source.source, visits.id as visit_id
+           FROM urls JOIN visits 
+           ON urls.id = visits.url LEFT JOIN visit_source ON visits.id = visit_source.id''',
+    29: '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
+               urls.hidden, urls.favicon_id, visits.visit_time, visits.from_visit, visits.visit_duration,
+               visits.transition, visit_source.source, visits.is_indexed, visits.id as visit_id
+           FROM urls JOIN visits 
+           ON urls.id = visits.url LEFT JOIN visit_source ON visits.id = visit_source.id''',
+    20: '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
+               urls.hidden, urls.favicon_id, visits.visit_time, visits.from_visit, visits.visit_duration,
+               visits.transition, visit_source.source, visits.is_indexed, visits.id as visit_id
+           FROM urls JOIN visits 
+           ON urls.id = visits.url LEFT JOIN visit_source ON visits.id = visit_source.id''',
+    7:  '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
+               urls.hidden, urls.favicon_id, visits.visit_time, visits.from_visit, visits.transition,
+               visit_source.source, visits.id as visit_id
+           FROM urls JOIN visits 
+           ON urls.id = visits.url LEFT JOIN visit_source ON visits.id = visit_source.id''',
+    1:  '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
+               urls.hidden, urls.favicon_id, visits.visit_time, visits.from_visit, visits.transition,
+               visits.id as visit_id
+           FROM urls, visits WHERE urls.id = visits.url'''
+}
+
+MEDIA_HISTORY_QUERIES = {
+    86: '''SELECT playback.url, playback.last_updated_time_s, playback.watch_time_s,
+               playback.has_video, playback.has_audio, playbackSession.title, 
+               playbackSession.source_title, playbackSession.duration_ms, playbackSession.position_ms
+           FROM playback LEFT JOIN playbackSession 
+               ON playback.last_updated_time_s = playbackSession.last_updated_time_s'''
+}
+
+DOWNLOAD_QUERIES = {
+    30: '''SELECT downloads.id, downloads_url_chains.url, downloads.received_bytes, downloads.total_bytes,
+               downloads.state, downloads.target_path, downloads.start_time, downloads.end_time,
+               downloads.opened, downloads.danger_type, downloads.interrupt_reason, downloads.etag,
+               downloads.last_modified, downloads_url_chains.chain_index
+           FROM downloads, downloads_url_chains WHERE downloads_url_chains.id = downloads.id''',
+    26: '''SELECT downloads.id, downloads_url_chains.url, downloads.received_bytes, downloads.total_bytes,
+               downloads.state, downloads.target_path, downloads.start_time, downloads.end_time,
+               downloads.opened, downloads.danger_type, downloads.interrupt_reason,
+               downloads_url_chains.chain_index
+           FROM downloads, downloads_url_chains WHERE downloads_url_chains.id = downloads.id''',
+    16: '''SELECT downloads.id, downloads.url, downloads.received_bytes, downloads.total_bytes,
+               downloads.state, downloads.full_path, downloads.start_time, downloads.end_time,
+               downloads.opened
+           FROM downloads''',
+    1:  '''SELECT downloads.id, downloads.url, downloads.received_bytes, downloads.total_bytes,
+               downloads.state, downloads.full_path, downloads.start_time
+           FROM downloads'''
+}
+
+COOKIE_QUERIES = {
+    66: '''SELECT cookies.host_key, cookies.path, cookies.name, cookies.value, cookies.creation_utc,
+               cookies.last_access_utc, cookies.expires_utc, cookies.is_secure AS secure, 
+               cookies.is_httponly AS httponly, cookies.is_persistent AS persistent, 
+               cookies.has_expires, cookies.priority, cookies.encrypted_value
+           FROM cookies''',
+    33: '''SELECT cookies.host_key, cookies.path, cookies.name, cookies.value, cookies.creation_utc,
+               cookies.last_access_utc, cookies.expires_utc, cookies.secure, cookies.httponly,
+               cookies.persistent, cookies.has_expires, cookies.priority, cookies.encrypted_value
+           FROM cookies''',
+    28: '''SELECT cookies.host_key, cookies.path, cookies.name, cookies.value, cookies.creation_utc,
+               cookies.last_access_utc, cookies.expires_utc, cookies.secure, cookies.httponly,
+               cookies.persistent, cookies.has_expires, cookies.priority
+           FROM cookies''',
+    17: '''SELECT cookies.host_key, cookies.path, cookies.name, cookies.value, cookies.creation_utc,
+               cookies.last_access_utc, cookies.expires_utc, cookies.secure, cookies.httponly,
+               cookies.persistent, cookies.has_expires
+           FROM cookies''',
+    1:  '''SELECT cookies.host_key, cookies.path, cookies.name, cookies.value, cookies.creation_utc,
+               cookies.last_access_utc, cookies.expires_utc, cookies.secure, cookies.httponly
+           FROM cookies'''
+}
+
+
+# Language names for the codes used by Chrome's translate feature. From
+# https://cs.chromium.org/chromium/src/components/translate/core/browser/translate_language_list.cc
+TRANSLATE_LANGUAGE_CODES = {
+    'af': 'Afrikaans',
+    'am': 'Amharic',
+    'ar': 'Arabic',
+    'az': 'Azerbaijani',
+    'be': 'Belarusian',
+    'bg': 'Bulgarian',
+    'bn': 'Bengali',
+    'bs': 'Bosnian',
+    'ca': 'Catalan',
+    'ceb': 'Cebuano',
+    'co': 'Corsican',
+    'cs': 'Czech',
+    'cy': 'Welsh',
+    'da': 'Danish',
+    'de': 'German',
+    'el': 'Greek',
+    'en': 'English',
+    'eo': 'Esperanto',
+    'es': 'Spanish',
+    'et': 'Estonian',
+    'eu': 'Basque',
+    'fa': 'Persian',
+    'fi': 'Finnish',
+    'fy': 'Frisian',
+    'fr': 'French',
+    'ga': 'Irish',
+    'gd': 'Scots Gaelic',
+    'gl': 'Galician',
+    'gu': 'Gujarati',
+    'ha': 'Hausa',
+    'haw': 'Hawaiian',
+    'hi': 'Hindi',
+    'hr': 'Croatian',
+    'ht': 'Haitian Creole',
+    'hu': 'Hungarian',
+    'hy': 'Armenian',
+    'id': 'Indonesian',
+    'ig': 'Igbo',
+    'is': 'Icelandic',
+    'it': 'Italian',
+    'iw': 'Hebrew',
+    'ja': 'Japanese',
+    'ka': 'Georgian',
+    'kk': 'Kazakh',
+    'km': 'Khmer',
+    'kn': 'Kannada',
+    'ko': 'Korean',
+    'ku': 'Kurdish',
+    'ky': 'Kyrgyz',
+    'la': 'Latin',
+    'lb': 'Luxembourgish',
+    'lo': 'Lao',
+    'lt': 'Lithuanian',
+    'lv': 'Latvian',
+    'mg': 'Malagasy',
+    'mi': 'Maori',
+    'mk': 'Macedonian',
+    'ml': 'Malayalam',
+    'mn': 'Mongolian',
+    'mr': 'Marathi',
+    'ms': 'Malay',
+    'mt': 'Maltese',
+    'my': 'Burmese',
+    'ne': 'Nepali',
+    'nl': 'Dutch',
+    'no': 'Norwegian',
+    'ny': 'Nyanja',
+    'pa': 'Punjabi',
+    'pl': 'Polish',
+    'ps': 'Pashto',
+    'pt': 'Portuguese',
+    'ro': 'Romanian',
+    'ru': 'Russian',
+    'sd': 'Sindhi',
+    'si': 'Sinhala',
+    'sk': 'Slovak',
+    'sl': 'Slovenian',
+    'sm': 'Samoan',
+    'sn': 'Shona',
+    'so': 'Somali',
+    'sq': 'Albanian',
+    'sr': 'Serbian',
+    'st': 'Southern Sotho',
+    'su': 'Sundanese',
+    'sv': 'Swedish',
+    'sw': 'Swahili',
+    'ta': 'Tamil',
+    'te': 'Telugu',
+    'tg': 'Tajik',
+    'th': 'Thai',
+    'tl': 'Tagalog',
+    'tr': 'Turkish',
+    'uk': 'Ukrainian',
+    'ur': 'Urdu',
+    'uz': 'Uzbek',
+    'vi': 'Vietnamese',
+    'yi': 'Yiddish',
+    'xh': 'Xhosa',
+    'yo': 'Yoruba',
+    'zh-CN': 'Chinese (Simplified)',
+    'zh-TW': 'Chinese (Traditional)',
+    'zu': 'Zulu'
+}
+
+# Local Storage LevelDB keys and values start with a byte marking how the rest is encoded. Maps that byte to
+# the arguments used to decode it (keys and values are decoded slightly differently).
+LS_KEY_ENCODINGS = {
+    0x01: 'utf-8',
+    0x00: 'utf-16'
+}
+LS_VALUE_ENCODINGS = {
+    0x01: ('utf-8', 'replace'),
+    0x00: ('utf-16', 'replace'),
+    0x08: ('utf-8', 'strict')
+}
+
+# Source: http://src.chromium.org/svn/trunk/src/content/public/common/page_transition_types_list.h
+PAGE_TRANSITION_TYPES = {
+    0: 'link',                 # User got to this page by clicking a link on another page.
+    1: 'typed',                # User got this page by typing the URL in the URL bar.  This should not be
+                               #  used for cases where the user selected a choice that didn't look at all
+                               #  like a URL; see GENERATED below.
+                               # We also use this for other 'explicit' navigation actions.
+    2: 'auto bookmark',        # User got to this page through a suggestion in the UI, for example)
+                               #  through the destinations page.
+    3: 'auto subframe',        # This is a subframe navigation. This is any content that is automatically
+                               #  loaded in a non-toplevel frame. For example, if a page consists of
+                               #  several frames containing ads, those ad URLs will have this transition
+                               #  type. The user may not even realize the content in these pages is a
+                               #  separate frame, so may not care about the URL (see MANUAL below).
+    4: 'manual subframe',      # For subframe navigations that are explicitly requested by the user and
+                               #  generate new navigation entries in the back/forward list. These are
+                               #  probably more important than frames that were automatically loaded in
+                               #  the background because the user probably cares about the fact that this
+                               #  link was loaded.
+    5: 'generated',            # User got to this page by typing in the URL bar and selecting an entry
+                               #  that did not look like a URL.  For example, a match might have the URL
+                               #  of a Google search result page, but appear like 'Search Google for ...'.
+                               #  These are not quite the same as TYPED navigations because the user
+                               #  didn't type or see the destination URL.
+                               #  See also KEYWORD.
+    6: 'start page',           # This is a toplevel navigation. This is any content that is automatically
+                               #  loaded in a toplevel frame.  For example, opening a tab to show the ASH
+                               #  screen saver, opening the devtools window, opening the NTP after the safe
+                               #  browsing warning, opening web-based dialog boxes are examples of
+                               #  AUTO_TOPLEVEL navigations.
+    7: 'form submit',          # The user filled out values in a form and submitted it. NOTE that in
+                               #  some situations submitting a form does not result in this transition
+                               #  type. This can happen if the form uses script to submit the contents.
+    8: 'reload',               # The user 'reloaded' the page, either by hitting the reload button or by
+                               #  hitting enter in the address bar.  NOTE: This is distinct from the
+                               #  concept of whether a particular load uses 'reload semantics' (i.e.
+                               #  bypasses cached data).  For this reason, lots of code needs to pass
+                               #  around the concept of whether a load should be treated as a 'reload'
+                               #  separately from their tracking of this transition type, which is mainly
+                               #  used for proper scoring for consumers who care about how frequently a
+                               #  user typed/visited a particular URL.
+                               #  SessionRestore and undo tab close use this transition type too.
+    9: 'keyword',              # The url was generated from a replaceable keyword other than the default
+                               #  search provider. If the user types a keyword (which also applies to
+                               #  tab-to-search) in the omnibox this qualifier is applied to the transition
+                               #  type of the generated url. TemplateURLModel then may generate an
+                               #  additional visit with a transition type of KEYWORD_GENERATED against the
+                               #  url 'http://' + keyword. For example, if you do a tab-to-search against
+                               #  wikipedia the generated url has a transition qualifer of KEYWORD, and
+                               #  TemplateURLModel generates a visit for 'wikipedia.org' with a transition
+                               #  type of KEYWORD_GENERATED.
+    10: 'keyword generated'    # Corresponds to a visit generated for a keyword. See description of
+                               #  KEYWORD for more details.
+}
+
+PAGE_TRANSITION_QUALIFIERS = {
+    0x00800000: 'Blocked',                # A managed user attempted to visit a URL but was blocked.
+    0x01000000: 'Forward or Back',        # User used the Forward or Back button to navigate among browsing
+                                          #  history.
+    0x02000000: 'From Address Bar',       # User used the address bar to trigger this navigation.
+    0x04000000: 'Home Page',              # User is navigating to the home page.
+    0x08000000: 'From API',               # The transition originated from an external application; the
+                                          #  exact definition of this is embedder dependent.
+    0x10000000: 'Navigation Chain Start', # The beginning of a navigation chain.
+    0x20000000: 'Navigation Chain End',   # The last transition in a redirect chain.
+    0x40000000: 'Client Redirect',        # Redirects caused by JavaScript or a meta refresh tag on the page
+    0x80000000: 'Server Redirect'         # Redirects sent from the server by HTTP headers. It might be nice
+                                          #  to break this out into 2 types in the future, permanent or
+                                          #  temporary, if we can get that information from WebKit.
+}
+
+# The qualifiers are all in the top nine bits of the transition (bits 23-31), so build the qualifier text for each
+# of the 512 possible combinations once, indexed by those bits, rather than testing each qualifier for every value.
+PAGE_TRANSITION_QUALIFIERS_SHIFT = 23
+PAGE_TRANSITION_QUALIFIER_TEXTS = tuple(
+    ''.join(f'{qualifier_friendly}; ' for qualifier, qualifier_friendly in PAGE_TRANSITION_QUALIFIERS.items()
+            if (qualifier_bits << PAGE_TRANSITION_QUALIFIERS_SHIFT) & qualifier)
+    for qualifier_bits in range(512))
+
+# https://source.chromium.org/chromium/chromium/src/+/master:components/history/core/browser/history_types.h
+VISIT_SOURCES = {
+    0:    'Synced',               # Synchronized from somewhere else.
+    1:    'Local',                # User browsed. In my experience, this value isn't written; it will be
+                                  # null. See https://cs.chromium.org/chromium/src/components/history/
+    None: 'Local',                #  core/browser/visit_database.cc
+    2:    'Added by Extension',   # Added by an extension.
+    3:    'Firefox (Imported)',
+    4:    'IE (Imported)',
+    5:    'Safari (Imported)',
+    6:    'Chrome/Edge (Imported)',
+    7:    'EdgeHTML (Imported)'}
+
+DOWNLOAD_INTERRUPT_REASONS = {
+    0:  'No Interrupt',                # Success
+
+    # from download_interrupt_reason_values.h on Chromium site
+    # File errors
+    1:  'File Error',                  # Generic file operation failure.
+    2:  'Access Denied',               # The file cannot be accessed due to security restrictions.
+    3:  'Disk Full',                   # There is not enough room on the drive.
+    5:  'Path Too Long',               # The directory or file name is too long.
+    6:  'File Too Large',              # The file is too large for the file system to handle.
+    7:  'Virus',                       # The file contains a virus.
+    10: 'Temporary Problem',           # The file was in use. Too many files are opened at once. We have run
+                                       #  out of memory.
+    11: 'Blocked',                     # The file was blocked due to local policy.
+    12: 'Security Check Failed',       # An attempt to check the safety of the download failed due to
+                                       #  unexpected reasons. See http://crbug.com/153212.
+    13: 'Resume Error',                # An attempt was made to seek past the end of a file in opening a
+                                       #  file (as part of resuming a previously interrupted download).
+
+    # Network errors
+    20: 'Network Error',               # Generic network failure.
+    21: 'Operation Timed Out',         # The network operation timed out.
+    22: 'Connection Lost',             # The network connection has been lost.
+    23: 'Server Down',                 # The server has gone down.
+
+    # Server responses
+    30: 'Server Error',                # The server indicates that the operation has failed (generic).
+    31: 'Range Request Error',         # The server does not support range requests.
+    32: 'Server Precondition Error',   # The download request does not meet the specified precondition.
+                                       #  Internal use only:  the file has changed on the server.
+    33: 'Unable to get file',          # The server does not have the requested data.
+    34: 'Server Unauthorized',         # Server didn't authorize access to resource.
+    35: 'Server Certificate Problem',  # Server certificate problem.
+    36: 'Server Access Forbidden',     # Server access forbidden.
+    37: 'Server Unreachable',          # Unexpected server response. This might indicate that the responding
+                                       #  server may not be the intended server.
+    38: 'Content Length Mismatch',     # The server sent fewer bytes than the content-length header. It may
+                                       #  indicate that the connection was closed prematurely, or the
+                                       #  Content-Length header was invalid. The download is only
+                                       #  interrupted if strong validators are present. Otherwise, it is
+                                       #  treated as finished.
+    39: 'Cross Origin Redirect',       # An unexpected cross-origin redirect happened.
+
+    # User input
+    40: 'Cancelled',                   # The user cancelled the download.
+    41: 'Browser Shutdown',            # The user shut down the browser.
+
+    # Crash
+    50: 'Browser Crashed'}             # The browser crashed.
+
+# from download_danger_type.h on Chromium site
+DOWNLOAD_DANGER_TYPES = {
+    0: 'Not Dangerous',                 # The download is safe.
+    1: 'Dangerous',                     # A dangerous file to the system (eg: a pdf or extension from places
+                                        #  other than gallery).
+    2: 'Dangerous URL',                 # Safe Browsing download service shows this URL leads to malicious
+                                        #  file download.
+    3: 'Dangerous Content',             # SafeBrowsing download service shows this file content as being
+                                        #  malicious.
+    4: 'Content May Be Malicious',      # The content of this download may be malicious (eg: extension is
+                                        #  exe but Safe Browsing has not finished checking the content).
+    5: 'Uncommon Content',              # Safe Browsing download service checked the contents of the
+                                        #  download, but didn't have enough data to determine whether
+                                        #  it was malicious.
+    6: 'Dangerous But User Validated',  # The download was evaluated to be one of the other types of danger,
+                                        #  but the user told us to go ahead anyway.
+    7: 'Dangerous Host',                # Safe Browsing download service checked the contents of the
+                                        #  download and didn't have data on this specific file,
+                                        #  but the file was served
+                                        #  from a host known to serve mostly malicious content.
+    8: 'Potentially Unwanted',          # Applications and extensions that modify browser and/or computer
+                                        #  settings
+    9: 'Allowlisted by Policy',         # Download URL allowed by enterprise policy.
+    10: 'Pending Scan',                 # Download is pending a more detailed verdict.
+    11: 'Blocked - Password Protected', # Download is password protected, and should be blocked according
+                                        #  to policy.
+    12: 'Blocked - Too Large',          # Download is too large, and should be blocked according to policy.
+    13: 'Warning - Sensitive Content',  # Download deep scanning identified sensitive content, and
+                                        #  recommended warning the user.
+    14: 'Blocked - Sensitive Content',  # Download deep scanning identified sensitive content, and
+                                        #  recommended blocking the file.
+    15: 'Safe - Deep Scanned',          # Download deep scanning identified no problems.
+    16: 'Dangerous, but user opened',   # Download deep scanning identified a problem, but the file has
+                                        #  already been opened by the user.
+    17: 'Prompt for Scanning',          # The user is enrolled in the Advanced Protection Program, and
+                                        #  the server has recommended this file be deep scanned.
+    18: 'Blocked - Unsupported Type'   # The download has a file type that is unsupported for deep
+                                        #  scanning, and should be blocked according to policy.
+}
+
+# from download_item.h on Chromium site
+DOWNLOAD_STATES = {
+    0: 'In Progress',   # Download is actively progressing.
+    1: 'Complete',      # Download is completely finished.
+    2: 'Cancelled',     # Download has been cancelled.
+    3: 'Interrupted',   # '3' was the old 'Interrupted' code until a bugfix in Chrome v22. 22+ it's '4'
+    4: 'Interrupted'}   # This state indicates that the download has been interrupted.
+
+# Extension directories are named with the extension's app ID, which is 32 lowercase letters
+EXTENSION_APP_ID_RE = re.compile(r'[a-z]{32}')
+
+# Extra History files (like "History__work") are processed with the suffix as a custom type
+HISTORY_CUSTOM_TYPE_RE = re.compile(r'__([A-Za-z0-9._]*)$')
+
+
+def extension_version_key(version_dir):
+    """Sort key for an extension's version directory (like '1.10.2_0'), comparing each numeric part in turn."""
+    return tuple(int(part) for part in re.split(r'[._]', version_dir) if part.isdigit())
+
+
+@functools.lru_cache(maxsize=8192)
+def cached_to_datetime(timestamp, timezone=None):
+    """Memoized utils.to_datetime, for loops where the same raw timestamps (often 0) recur across rows."""
+    return utils.to_datetime(timestamp, timezone)
+
 
 class Chrome(WebBrowser):
     def __init__(self, profile_path, browser_name=None, cache_path=None, version=None, timezone=None,
@@ -111,6 +527,8 @@ class Chrome(WebBrowser):
             from Cryptodome.Cipher import AES
             from Cryptodome.Protocol.KDF import PBKDF2
 
+        self.decrypt_function = self.select_decrypt_function()
+
     def determine_version(self):
         """Determine version of Chrome databases files by looking for combinations of columns in certain tables.
         Based on research I did to create "Chrome Evolution" tool - dfir.blog/chrome-evolution
@@ -151,10 +569,10 @@ class Chrome(WebBrowser):
             """Remove version numbers < 'version' from 'possible_versions'"""
             possible_versions[:] = [x for x in possible_versions if x >= version]
 
-        if 'History' in list(self.structure.keys()):
+        if 'History' in self.structure:
             log.debug('Analyzing \'History\' structure')
             log.debug(f' - Starting possible versions:  {possible_versions}')
-            if 'visits' in list(self.structure['History'].keys()):
+            if 'visits' in self.structure['History']:
                 trim_lesser_versions_if('visit_duration', self.structure['History']['visits'], 20)
                 trim_lesser_versions_if('incremented_omnibox_typed_score', self.structure['History']['visits'], 68)
                 trim_lesser_versions_if('originator_from_visit', self.structure['History']['visits'], 106)
@@ -163,28 +581,28 @@ class Chrome(WebBrowser):
                 trim_lesser_versions_if('external_referrer_url', self.structure['History']['visits'], 117)
                 trim_lesser_versions_if('visited_link_id', self.structure['History']['visits'], 119)
                 trim_lesser_versions_if('app_id', self.structure['History']['visits'], 122)
-            if 'visit_source' in list(self.structure['History'].keys()):
+            if 'visit_source' in self.structure['History']:
                 trim_lesser_versions_if('source', self.structure['History']['visit_source'], 7)
-            if 'downloads' in list(self.structure['History'].keys()):
+            if 'downloads' in self.structure['History']:
                 trim_lesser_versions_if('target_path', self.structure['History']['downloads'], 26)
                 trim_lesser_versions_if('opened', self.structure['History']['downloads'], 16)
                 trim_lesser_versions_if('etag', self.structure['History']['downloads'], 30)
                 trim_lesser_versions_if('original_mime_type', self.structure['History']['downloads'], 37)
                 trim_lesser_versions_if('last_access_time', self.structure['History']['downloads'], 59)
                 trim_lesser_versions_if('by_web_app_id', self.structure['History']['downloads'], 115)
-            if 'downloads_slices' in list(self.structure['History'].keys()):
+            if 'downloads_slices' in self.structure['History']:
                 trim_lesser_versions(58)
-            if 'content_annotations' in list(self.structure['History'].keys()):
+            if 'content_annotations' in self.structure['History']:
                 trim_lesser_versions(91)
                 trim_lesser_versions_if('related_searches', self.structure['History']['content_annotations'], 94)
                 trim_lesser_versions_if('visibility_score', self.structure['History']['content_annotations'], 95)
                 trim_lesser_versions_if('search_terms', self.structure['History']['content_annotations'], 100)
                 trim_lesser_versions_if('alternative_title', self.structure['History']['content_annotations'], 104)
-            if 'context_annotations' in list(self.structure['History'].keys()):
+            if 'context_annotations' in self.structure['History']:
                 trim_lesser_versions(92)
                 trim_lesser_versions_if(
                     'total_foreground_duration', self.structure['History']['context_annotations'], 96)
-            if 'clusters' in list(self.structure['History'].keys()):
+            if 'clusters' in self.structure['History']:
                 trim_lesser_versions(93)
                 trim_lesser_versions_if('originator_cluster_id', self.structure['History']['clusters'], 111)
             log.debug(f' - Finishing possible versions: {possible_versions}')
@@ -192,10 +610,10 @@ class Chrome(WebBrowser):
         possible_versions, previous_possible_versions = \
             update_and_rollback_if_empty(possible_versions, previous_possible_versions)
 
-        if 'Cookies' in list(self.structure.keys()):
+        if 'Cookies' in self.structure:
             log.debug("Analyzing 'Cookies' structure")
             log.debug(f' - Starting possible versions:  {possible_versions}')
-            if 'cookies' in list(self.structure['Cookies'].keys()):
+            if 'cookies' in self.structure['Cookies']:
                 trim_lesser_versions_if('source_port', self.structure['Cookies']['cookies'], 88)
                 trim_lesser_versions_if('source_scheme', self.structure['Cookies']['cookies'], 80)
                 trim_lesser_versions_if('samesite', self.structure['Cookies']['cookies'], 76)
@@ -208,72 +626,72 @@ class Chrome(WebBrowser):
         possible_versions, previous_possible_versions = \
             update_and_rollback_if_empty(possible_versions, previous_possible_versions)
 
-        if 'Web Data' in list(self.structure.keys()):
+        if 'Web Data' in self.structure:
             log.debug("Analyzing 'Web Data' structure")
             log.debug(f' - Starting possible versions:  {possible_versions}')
-            if 'autofill' in list(self.structure['Web Data'].keys()):
+            if 'autofill' in self.structure['Web Data']:
                 trim_lesser_versions_if('name', self.structure['Web Data']['autofill'], 2)
                 trim_lesser_versions_if('date_created', self.structure['Web Data']['autofill'], 35)
-            if 'autofill_profiles' in list(self.structure['Web Data'].keys()):
+            if 'autofill_profiles' in self.structure['Web Data']:
                 trim_lesser_versions_if('language_code', self.structure['Web Data']['autofill_profiles'], 36)
                 trim_lesser_versions_if('validity_bitfield', self.structure['Web Data']['autofill_profiles'], 63)
                 trim_lesser_versions_if(
                     'is_client_validity_states_updated', self.structure['Web Data']['autofill_profiles'], 71)
-            if 'autofill_profile_addresses' in list(self.structure['Web Data'].keys()):
+            if 'autofill_profile_addresses' in self.structure['Web Data']:
                 trim_lesser_versions(86)
                 trim_lesser_versions_if('city', self.structure['Web Data']['autofill_profile_addresses'], 87)
-            if 'autofill_sync_metadata' in list(self.structure['Web Data'].keys()):
+            if 'autofill_sync_metadata' in self.structure['Web Data']:
                 trim_lesser_versions(57)
                 trim_lesser_versions_if('model_type', self.structure['Web Data']['autofill_sync_metadata'], 69)
-            if 'web_apps' not in list(self.structure['Web Data'].keys()):
+            if 'web_apps' not in self.structure['Web Data']:
                 trim_lesser_versions(38)
-            if 'credit_cards' in list(self.structure['Web Data'].keys()):
+            if 'credit_cards' in self.structure['Web Data']:
                 trim_lesser_versions_if('billing_address_id', self.structure['Web Data']['credit_cards'], 53)
                 trim_lesser_versions_if('nickname', self.structure['Web Data']['credit_cards'], 85)
-            if 'masked_bank_accounts' in list(self.structure['Web Data'].keys()):
+            if 'masked_bank_accounts' in self.structure['Web Data']:
                 trim_lesser_versions(123)
-            if 'plus_addresses' in list(self.structure['Web Data'].keys()):
+            if 'plus_addresses' in self.structure['Web Data']:
                 trim_lesser_versions(124)
-            if 'addresses' in list(self.structure['Web Data'].keys()):
+            if 'addresses' in self.structure['Web Data']:
                 trim_lesser_versions(130)
             log.debug(f' - Finishing possible versions: {possible_versions}')
 
         possible_versions, previous_possible_versions = \
             update_and_rollback_if_empty(possible_versions, previous_possible_versions)
 
-        if 'Login Data' in list(self.structure.keys()):
+        if 'Login Data' in self.structure:
             log.debug("Analyzing 'Login Data' structure")
             log.debug(f' - Starting possible versions:  {possible_versions}')
-            if 'logins' in list(self.structure['Login Data'].keys()):
+            if 'logins' in self.structure['Login Data']:
                 trim_lesser_versions_if('display_name', self.structure['Login Data']['logins'], 39)
                 trim_lesser_versions_if('generation_upload_status', self.structure['Login Data']['logins'], 42)
                 trim_greater_versions_if('ssl_valid', self.structure['Login Data']['logins'], 53)
                 trim_lesser_versions_if('possible_username_pairs', self.structure['Login Data']['logins'], 59)
                 trim_lesser_versions_if('id', self.structure['Login Data']['logins'], 73)
                 trim_lesser_versions_if('moving_blocked_for', self.structure['Login Data']['logins'], 84)
-            if 'field_info' in list(self.structure['Login Data'].keys()):
+            if 'field_info' in self.structure['Login Data']:
                 trim_lesser_versions(80)
-            if 'compromised_credentials' in list(self.structure['Login Data'].keys()):
+            if 'compromised_credentials' in self.structure['Login Data']:
                 trim_lesser_versions(83)
-            if 'insecure_credentials' in list(self.structure['Login Data'].keys()):
+            if 'insecure_credentials' in self.structure['Login Data']:
                 trim_lesser_versions(89)
             log.debug(f' - Finishing possible versions: {possible_versions}')
 
         possible_versions, previous_possible_versions = \
             update_and_rollback_if_empty(possible_versions, previous_possible_versions)
 
-        if 'Network Action Predictor' in list(self.structure.keys()):
+        if 'Network Action Predictor' in self.structure:
             log.debug("Analyzing 'Network Action Predictor' structure")
             log.debug(f' - Starting possible versions:  {possible_versions}')
-            if 'resource_prefetch_predictor_url' in list(self.structure['Network Action Predictor'].keys()):
+            if 'resource_prefetch_predictor_url' in self.structure['Network Action Predictor']:
                 trim_lesser_versions(22)
                 trim_lesser_versions_if(
                     'key', self.structure['Network Action Predictor']['resource_prefetch_predictor_url'], 55)
                 trim_lesser_versions_if(
                     'proto', self.structure['Network Action Predictor']['resource_prefetch_predictor_url'], 54)
-            if 'lcp_critical_path_predictor' in list(self.structure['Network Action Predictor'].keys()):
+            if 'lcp_critical_path_predictor' in self.structure['Network Action Predictor']:
                 trim_lesser_versions(117)
-            if 'lcp_critical_path_predictor_initiator_origin' in list(self.structure['Network Action Predictor'].keys()):
+            if 'lcp_critical_path_predictor_initiator_origin' in self.structure['Network Action Predictor']:
                 trim_lesser_versions(129)
             log.debug(f' - Finishing possible versions: {possible_versions}')
 
@@ -287,41 +705,10 @@ class Chrome(WebBrowser):
 
         log.info(f'History items from {history_file}')
 
-        # Queries for different versions
-        query = {59: '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
-                            urls.hidden, visits.visit_time, visits.from_visit, visits.visit_duration,
-                            visits.transition, visit_source.source, visits.id as visit_id
-                        FROM urls JOIN visits 
-                        ON urls.id = visits.url LEFT JOIN visit_source ON visits.id = visit_source.id''',
-                 30: '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
-                            urls.hidden, urls.favicon_id, visits.visit_time, visits.from_visit, visits.visit_duration,
-                            visits.transition, visit_source.source, visits.id as visit_id
-                        FROM urls JOIN visits 
-                        ON urls.id = visits.url LEFT JOIN visit_source ON visits.id = visit_source.id''',
-                 29: '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
-                            urls.hidden, urls.favicon_id, visits.visit_time, visits.from_visit, visits.visit_duration,
-                            visits.transition, visit_source.source, visits.is_indexed, visits.id as visit_id
-                        FROM urls JOIN visits 
-                        ON urls.id = visits.url LEFT JOIN visit_source ON visits.id = visit_source.id''',
-                 20: '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
-                            urls.hidden, urls.favicon_id, visits.visit_time, visits.from_visit, visits.visit_duration,
-                            visits.transition, visit_source.source, visits.is_indexed, visits.id as visit_id
-                        FROM urls JOIN visits 
-                        ON urls.id = visits.url LEFT JOIN visit_source ON visits.id = visit_source.id''',
-                 7:  '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
-                            urls.hidden, urls.favicon_id, visits.visit_time, visits.from_visit, visits.transition,
-                            visit_source.source, visits.id as visit_id
-                        FROM urls JOIN visits 
-                        ON urls.id = visits.url LEFT JOIN visit_source ON visits.id = visit_source.id''',
-                 1:  '''SELECT urls.id, urls.url, urls.title, urls.visit_count, urls.typed_count, urls.last_visit_time,
-                            urls.hidden, urls.favicon_id, visits.visit_time, visits.from_visit, visits.transition,
-                            visits.id as visit_id
-                        FROM urls, visits WHERE urls.id = visits.url'''}
-
-        # Get the lowest possible version from the version list, and decrement it until it finds a matching query
-        compatible_version = version[0]
-        while compatible_version not in list(query.keys()) and compatible_version > 0:
-            compatible_version -= 1
+        query = HISTORY_QUERIES
+
+        # Get the lowest possible version from the version list, and find the newest query that applies to it
+        compatible_version = utils.get_compatible_version(query, version[0])
 
         if compatible_version != 0:
             log.info(f' - Using SQL query for History items for Chrome {compatible_version}')
@@ -341,15 +728,24 @@ class Chrome(WebBrowser):
                     self.artifacts_counts[history_file] = 'Failed'
                     return
 
+                # Every visit row repeats the url, title, and last_visit_time of the URL it belongs to. Build
+                # these once per URL, so all visits to the same page share them rather than each holding a copy.
+                url_values = {}
+
                 for row in cursor:
                     duration = None
                     if row.get('visit_duration'):
                         duration = datetime.timedelta(microseconds=row.get('visit_duration'))
 
+                    if row.get('id') not in url_values:
+                        url_values[row.get('id')] = (
+                            row.get('url'), row.get('title'),
+                            utils.to_datetime(row.get('last_visit_time'), self.timezone))
+                    url, title, last_visit_time = url_values[row.get('id')]
+
                     new_row = Chrome.URLItem(
-                        self.profile_path, row.get('visit_id'), row.get('url'), row.get('title'),
-                        utils.to_datetime(row.get('visit_time'), self.timezone),
-                        utils.to_datetime(row.get('last_visit_time'), self.timezone),
+                        self.profile_path, row.get('visit_id'), url, title,
+                        utils.to_datetime(row.get('visit_time'), self.timezone), last_visit_time,
                         row.get('visit_count'), row.get('typed_count'), row.get('from_visit'),
                         row.get('transition'), row.get('hidden'), row.get('favicon_id'),
                         row.get('is_indexed'), str(duration), row.get('source'))
@@ -381,17 +777,10 @@ class Chrome(WebBrowser):
 
         log.info(f'Media History items from {history_file}')
 
-        # Queries for different versions
-        query = {86: '''SELECT playback.url, playback.last_updated_time_s, playback.watch_time_s,
-                            playback.has_video, playback.has_audio, playbackSession.title, 
-                            playbackSession.source_title, playbackSession.duration_ms, playbackSession.position_ms
-                        FROM playback LEFT JOIN playbackSession 
-                            ON playback.last_updated_time_s = playbackSession.last_updated_time_s'''}
+        query = MEDIA_HISTORY_QUERIES
 
-        # Get the lowest possible version from the version list, and decrement it until it finds a matching query
-        compatible_version = version[0]
-        while compatible_version not in list(query.keys()) and compatible_version > 0:
-            compatible_version -= 1
+        # Get the lowest possible version from the version list, and find the newest query that applies to it
+        compatible_version = utils.get_compatible_version(query, version[0])
 
         if compatible_version != 0:
             log.info(f' - Using SQL query for Media History items for Chrome {compatible_version}')
@@ -457,29 +846,10 @@ class Chrome(WebBrowser):
 
         log.info(f'Download items from {database}:')
 
-        # Queries for different versions
-        query = {30: '''SELECT downloads.id, downloads_url_chains.url, downloads.received_bytes, downloads.total_bytes,
-                            downloads.state, downloads.target_path, downloads.start_time, downloads.end_time,
-                            downloads.opened, downloads.danger_type, downloads.interrupt_reason, downloads.etag,
-                            downloads.last_modified, downloads_url_chains.chain_index
-                        FROM downloads, downloads_url_chains WHERE downloads_url_chains.id = downloads.id''',
-                 26: '''SELECT downloads.id, downloads_url_chains.url, downloads.received_bytes, downloads.total_bytes,
-                            downloads.state, downloads.target_path, downloads.start_time, downloads.end_time,
-                            downloads.opened, downloads.danger_type, downloads.interrupt_reason,
-                            downloads_url_chains.chain_index
-                        FROM downloads, downloads_url_chains WHERE downloads_url_chains.id = downloads.id''',
-                 16: '''SELECT downloads.id, downloads.url, downloads.received_bytes, downloads.total_bytes,
-                            downloads.state, downloads.full_path, downloads.start_time, downloads.end_time,
-                            downloads.opened
-                        FROM downloads''',
-                 1:  '''SELECT downloads.id, downloads.url, downloads.received_bytes, downloads.total_bytes,
-                            downloads.state, downloads.full_path, downloads.start_time
-                        FROM downloads'''}
-
-        # Get the lowest possible version from the version list, and decrement it until it finds a matching query
-        compatible_version = version[0]
-        while compatible_version not in list(query.keys()) and compatible_version > 0:
-            compatible_version -= 1
+        query = DOWNLOAD_QUERIES
+
+        # Get the lowest possible version from the version list, and find the newest query that applies to it
+        compatible_version = utils.get_compatible_version(query, version[0])
 
         if compatible_version != 0:
             log.info(f' - Using SQL query for Download items for Chrome v{compatible_version}')
@@ -548,67 +918,94 @@ class Chrome(WebBrowser):
                 self.artifacts_counts[database + '_downloads'] = 'Failed'
                 log.error(f' - Couldn\'t read "downloads" from {os.path.join(path, database)}; {e}')
 
+    # Constants used by Chromium's os_crypt when deriving the Mac/Linux cookie encryption key
+    cookie_salt = b'saltysalt'
+    cookie_iv = b' ' * 16
+    cookie_key_length = 16
+
+    def select_decrypt_function(self):
+        """Pick the cookie decryption function for this platform and the available decrypts.
+
+        Neither changes over the course of processing a profile, so this is done once (in __init__) rather
+        than re-checking sys.platform and available_decrypts for every encrypted value.
+        """
+        # If running Chrome on Windows
+        if sys.platform == 'win32' and self.available_decrypts['windows'] == 1:
+            return self.decrypt_windows
+        # If running Chrome on OSX
+        elif sys.platform == 'darwin' and self.available_decrypts['mac'] == 1:
+            return self.decrypt_mac
+        # If running Chromium on Linux.
+        elif self.available_decrypts['linux'] == 1:
+            return self.decrypt_linux
+        else:
+            return lambda encrypted_value: "<encrypted>"
+
+    @staticmethod
+    def chrome_decrypt(encrypted, key=None):
+        # Encrypted cookies should be prefixed with 'v10' according to the
+        # Chromium code. Strip it off.
+        encrypted = encrypted[3:]
+
+        cipher = AES.new(key, AES.MODE_CBC, IV=Chrome.cookie_iv)
+        decrypted = cipher.decrypt(encrypted)
+
+        # Strip padding by taking off number indicated by padding
+        # eg if last is b'\x0e' then decrypted[-1] == 14, so take off 14.
+        # A padding value outside 1-16 means the key or ciphertext was bad.
+        pad = decrypted[-1]
+        if not 1 <= pad <= Chrome.cookie_key_length:
+            return None
+
+        return decrypted[:-pad]
+
+    def decrypt_windows(self, encrypted_value):
+        try:
+            return win32crypt.CryptUnprotectData(encrypted_value, None, None, None, 0)[1]
+        except:
+            # Fall back to trying the Linux method
+            if self.available_decrypts['linux'] == 1:
+                return self.decrypt_linux(encrypted_value)
+            return "<encrypted>"
+
+    def decrypt_mac(self, encrypted_value):
+        try:
+            if not self.cached_key:
+                my_pass = keyring.get_password('Chrome Safe Storage', 'Chrome')
+                my_pass = my_pass.encode('utf8')
+                iterations = 1003
+                self.cached_key = PBKDF2(my_pass, self.cookie_salt, self.cookie_key_length, iterations)
+            decrypted = self.chrome_decrypt(encrypted_value, key=self.cached_key)
+            if decrypted is not None:
+                return decrypted
+        except:
+            pass
+        return "<error>"
+
+    def decrypt_linux(self, encrypted_value):
+        # Unlike Win/Mac, we can decrypt Linux cookies without the user's pw
+        try:
+            if not self.cached_key:
+                my_pass = 'peanuts'
+                iterations = 1
+                self.cached_key = PBKDF2(my_pass, self.cookie_salt, self.cookie_key_length, iterations)
+            decrypted = self.chrome_decrypt(encrypted_value, key=self.cached_key)
+            if decrypted is not None:
+                return decrypted
+        except:
+            pass
+        return "<encrypted>"
+
     def decrypt_cookie(self, encrypted_value):
         """Decryption based on work by Nathan Henrie and Jordan Wright as well as Chromium source:
          - Mac/Linux: http://n8henrie.com/2014/05/decrypt-chrome-cookies-with-python/
          - Windows: https://gist.github.com/jordan-wright/5770442#file-chrome_extract-py
          - Relevant Chromium source code: http://src.chromium.org/viewvc/chrome/trunk/src/components/os_crypt/
          """
-        salt = b'saltysalt'
-        iv = b' ' * 16
-        length = 16
-
-        def chrome_decrypt(encrypted, key=None):
-            # Encrypted cookies should be prefixed with 'v10' according to the
-            # Chromium code. Strip it off.
-            encrypted = encrypted[3:]
-
-            # Strip padding by taking off number indicated by padding
-            # eg if last is '\x0e' then ord('\x0e') == 14, so take off 14.
-            def clean(x):
-                return x[:-ord(x[-1])]
-
-            cipher = AES.new(key, AES.MODE_CBC, IV=iv)
-            decrypted = cipher.decrypt(encrypted)
-
-            return clean(decrypted)
-
-        decrypted_value = "<error>"
-        if encrypted_value is not None:
-            if len(encrypted_value) >= 2:
-                # If running Chrome on Windows
-                if sys.platform == 'win32' and self.available_decrypts['windows'] == 1:
-                    try:
-                        decrypted_value = win32crypt.CryptUnprotectData(encrypted_value, None, None, None, 0)[1]
-                    except:
-                        decrypted_value = "<encrypted>"
-                # If running Chrome on OSX
-                elif sys.platform == 'darwin' and self.available_decrypts['mac'] == 1:
-                    try:
-                        if not self.cached_key:
-                            my_pass = keyring.get_password('Chrome Safe Storage', 'Chrome')
-                            my_pass = my_pass.encode('utf8')
-                            iterations = 1003
-                            self.cached_key = PBKDF2(my_pass, salt, length, iterations)
-                        decrypted_value = chrome_decrypt(encrypted_value, key=self.cached_key)
-                    except:
-                        pass
-                else:
-                    decrypted_value = "<encrypted>"
+        if encrypted_value is None or len(encrypted_value) < 2:
+            return "<error>"
 
-                # If running Chromium on Linux.
-                # Unlike Win/Mac, we can decrypt Linux cookies without the user's pw
-                if decrypted_value == "<encrypted>" and self.available_decrypts['linux'] == 1:
-                    try:
-                        if not self.cached_key:
-                            my_pass = 'peanuts'
-                            iterations = 1
-                            self.cached_key = PBKDF2(my_pass, salt, length, iterations)
-                        decrypted_value = chrome_decrypt(encrypted_value, key=self.cached_key)
-                    except:
-                        pass
-
-        return decrypted_value
+        return self.decrypt_function(encrypted_value)
 
     def get_cookies(self, path, database, version):
         # Set up empty return array
@@ -616,32 +1013,10 @@ class Chrome(WebBrowser):
 
         log.info(f'Cookie items from {database}:')
 
-        # Queries for different versions
-        query = {66: '''SELECT cookies.host_key, cookies.path, cookies.name, cookies.value, cookies.creation_utc,
-                            cookies.last_access_utc, cookies.expires_utc, cookies.is_secure AS secure, 
-                            cookies.is_httponly AS httponly, cookies.is_persistent AS persistent, 
-                            cookies.has_expires, cookies.priority, cookies.encrypted_value
-                        FROM cookies''',
-                 33: '''SELECT cookies.host_key, cookies.path, cookies.name, cookies.value, cookies.creation_utc,
-                            cookies.last_access_utc, cookies.expires_utc, cookies.secure, cookies.httponly,
-                            cookies.persistent, cookies.has_expires, cookies.priority, cookies.encrypted_value
-                        FROM cookies''',
-                 28: '''SELECT cookies.host_key, cookies.path, cookies.name, cookies.value, cookies.creation_utc,
-                            cookies.last_access_utc, cookies.expires_utc, cookies.secure, cookies.httponly,
-                            cookies.persistent, cookies.has_expires, cookies.priority
-                        FROM cookies''',
-                 17: '''SELECT cookies.host_key, cookies.path, cookies.name, cookies.value, cookies.creation_utc,
-                            cookies.last_access_utc, cookies.expires_utc, cookies.secure, cookies.httponly,
-                            cookies.persistent, cookies.has_expires
-                        FROM cookies''',
-                 1:  '''SELECT cookies.host_key, cookies.path, cookies.name, cookies.value, cookies.creation_utc,
-                            cookies.last_access_utc, cookies.expires_utc, cookies.secure, cookies.httponly
-                        FROM cookies'''}
-
-        # Get the lowest possible version from the version list, and decrement it until it finds a matching query
-        compatible_version = version[0]
-        while compatible_version not in list(query.keys()) and compatible_version > 0:
-            compatible_version -= 1
+        query = COOKIE_QUERIES
+
+        # Get the lowest possible version from the version list, and find the newest query that applies to it
+        compatible_version = utils.get_compatible_version(query, version[0])
 
         if compatible_version != 0:
             log.info(f' - Using SQL query for Cookie items for Chrome v{compatible_version}')
@@ -656,44 +1031,44 @@ class Chrome(WebBrowser):
                 # Use highest compatible version SQL to select download data
                 cursor.execute(query[compatible_version])
 
-                for row in cursor:
-                    if row.get('encrypted_value') is not None:
-                        if len(row.get('encrypted_value')) >= 2:
-                            cookie_value = self.decrypt_cookie(row.get('encrypted_value'))
+                profile_path = self.profile_path
+                timezone = self.timezone
+                CookieItem = Chrome.CookieItem
+                append_result = results.append
+                cursor.arraysize = 1000
+                while rows := cursor.fetchmany():
+                    for row in rows:
+                        encrypted_value = row.get('encrypted_value')
+                        if encrypted_value is not None and len(encrypted_value) >= 2:
+                            cookie_value = self.decrypt_cookie(encrypted_value)
                         else:
                             cookie_value = row.get('value')
-                    else:
-                        cookie_value = row.get('value')
-
-                    new_row = Chrome.CookieItem(
-                        self.profile_path, row.get('host_key'), row.get('path'), row.get('name'), cookie_value,
-                        utils.to_datetime(row.get('creation_utc'), self.timezone),
-                        utils.to_datetime(row.get('last_access_utc'), self.timezone), row.get('secure'),
-                        row.get('httponly'), row.get('persistent'), row.get('has_expires'),
-                        utils.to_datetime(row.get('expires_utc'), self.timezone), row.get('priority'))
-
-                    accessed_row = Chrome.CookieItem(
-                        self.profile_path, row.get('host_key'), row.get('path'), row.get('name'), cookie_value,
-                        utils.to_datetime(row.get('creation_utc'), self.timezone),
-                        utils.to_datetime(row.get('last_access_utc'), self.timezone), row.get('secure'),
-                        row.get('httponly'), row.get('persistent'), row.get('has_expires'),
-                        utils.to_datetime(row.get('expires_utc'), self.timezone), row.get('priority'))
-
-                    new_row.url = (new_row.host_key + new_row.path)
-                    accessed_row.url = (accessed_row.host_key + accessed_row.path)
-
-                    # Create the row for when the cookie was created
-                    new_row.row_type = 'cookie (created)'
-                    new_row.timestamp = new_row.creation_utc
-                    results.append(new_row)
 
-                    # If the cookie was created and accessed at the same time (only used once), or if the last accessed
-                    # time is 0 (happens on iOS), don't create an accessed row
-                    if new_row.creation_utc != new_row.last_access_utc and \
-                            accessed_row.last_access_utc != utils.to_datetime(0, self.timezone):
-                        accessed_row.row_type = 'cookie (accessed)'
-                        accessed_row.timestamp = accessed_row.last_access_utc
-                        results.append(accessed_row)
+                        raw_creation_utc = row.get('creation_utc')
+                        raw_last_access_utc = row.get('last_access_utc')
+                        creation_utc = cached_to_datetime(raw_creation_utc, timezone)
+                        last_access_utc = cached_to_datetime(raw_last_access_utc, timezone)
+                        expires_utc = cached_to_datetime(row.get('expires_utc'), timezone)
+
+                        new_row = CookieItem(
+                            profile_path, row.get('host_key'), row.get('path'), row.get('name'), cookie_value,
+                            creation_utc, last_access_utc, row.get('secure'), row.get('httponly'),
+                            row.get('persistent'), row.get('has_expires'), expires_utc, row.get('priority'))
+
+                        new_row.url = (new_row.host_key + new_row.path)
+
+                        # Create the row for when the cookie was created
+                        new_row.row_type = 'cookie (created)'
+                        new_row.timestamp = new_row.creation_utc
+                        append_result(new_row)
+
+                        # If the cookie was created and accessed at the same time (only used once), or if the last
+                        # accessed time is 0 or missing (happens on iOS), don't create an accessed row
+                        if raw_creation_utc != raw_last_access_utc and raw_last_access_utc:
+                            accessed_row = copy.copy(new_row)
+                            accessed_row.row_type = 'cookie (accessed)'
+                            accessed_row.timestamp = last_access_utc
+                            append_result(accessed_row)
 
                 conn.close()
                 self.artifacts_counts[database] = len(results)
@@ -719,10 +1094,8 @@ class Chrome(WebBrowser):
                  6:  '''SELECT origin_url, action_url, username_element, username_value, password_element,
                             password_value, date_created, blacklisted_by_user FROM logins'''}
 
-        # Get the lowest possible version from the version list, and decrement it until it finds a matching query
-        compatible_version = version[0]
-        while compatible_version not in list(query.keys()) and compatible_version > 0:
-            compatible_version -= 1
+        # Get the lowest possible version from the version list, and find the newest query that applies to it
+        compatible_version = utils.get_compatible_version(query, version[0])
 
         if compatible_version != 0:
             log.info(f' - Using SQL query for Login items for Chrome v{compatible_version}')
@@ -737,92 +1110,101 @@ class Chrome(WebBrowser):
             # Use the highest compatible version SQL to select download data
             cursor.execute(query[compatible_version])
 
-            for row in cursor:
-                if row.get('blacklisted_by_user') == 1:
-                    never_save_row = Chrome.LoginItem(
-                        self.profile_path, utils.to_datetime(row.get('date_created'), self.timezone),
-                        url=row.get('origin_url'), name=row.get('username_element'),
-                        value='', count=row.get('times_used'),
-                        interpretation='User chose to "Never save password" for this site')
-                    never_save_row.row_type = 'login (never save)'
-                    results.append(never_save_row)
-
-                elif row.get('username_value'):
-                    interpretation_str = 'User chose to save the credentials entered'
-                    if row.get('times_used') and row.get('times_used') > 0:
-                        interpretation_str += f' (times used: {row.get("times_used")})'
-
-                    username_row = Chrome.LoginItem(
-                        self.profile_path, utils.to_datetime(row.get('date_created'), self.timezone),
-                        url=row.get('origin_url'), name=row.get('username_element'),
-                        value=row.get('username_value'), count=row.get('times_used'),
-                        interpretation=interpretation_str)
-                    username_row.row_type = 'login (saved credentials)'
-                    results.append(username_row)
-
-                    # 'date_last_used' was added in v78; some older records may have small, invalid values; skip them.
-                    if row.get('date_last_used') and int(row.get('date_last_used')) > 13100000000000000:
-                        interpretation_str = 'User tried to log in with this username (may or may not have succeeded)'
-                        if row.get('times_used') and row.get('times_used') > 0:
-                            interpretation_str += f'; times used: {row.get("times_used")})'
-                            
-                        username_row = Chrome.LoginItem(
-                            self.profile_path, utils.to_datetime(row.get('date_last_used'), self.timezone),
-                            url=row.get('origin_url'), name=row.get('username_element'),
-                            value=row.get('username_value'), count=row.get('times_used'),
+            profile_path = self.profile_path
+            timezone = self.timezone
+            LoginItem = Chrome.LoginItem
+            append_result = results.append
+            cursor.arraysize = 1000
+            while rows := cursor.fetchmany():
+                for row in rows:
+                    origin_url = row.get('origin_url')
+                    times_used = row.get('times_used')
+                    username_value = row.get('username_value')
+                    date_created = cached_to_datetime(row.get('date_created'), timezone)
+
+                    if row.get('blacklisted_by_user') == 1:
+                        never_save_row = LoginItem(
+                            profile_path, date_created,
+                            url=origin_url, name=row.get('username_element'),
+                            value='', count=times_used,
+                            interpretation='User chose to "Never save password" for this site')
+                        never_save_row.row_type = 'login (never save)'
+                        append_result(never_save_row)
+
+                    elif username_value:
+                        interpretation_str = 'User chose to save the credentials entered'
+                        if times_used and times_used > 0:
+                            interpretation_str += f' (times used: {times_used})'
+
+                        username_row = LoginItem(
+                            profile_path, date_created,
+                            url=origin_url, name=row.get('username_element'),
+                            value=username_value, count=times_used,
                             interpretation=interpretation_str)
-                        username_row.row_type = 'login (username)'
-                        results.append(username_row)
-
-                if row.get('password_value') is not None and self.available_decrypts['windows'] == 1:
-                    try:
-                        # Windows is all I've had time to test; Ubuntu uses built-in password manager
-                        password = win32crypt.CryptUnprotectData(
-                            row.get('password_value').decode(), None, None, None, 0)[1]
-                    except:
-                        password = self.decrypt_cookie(row.get('password_value'))
-
-                    password_row = Chrome.LoginItem(
-                        self.profile_path, utils.to_datetime(row.get('date_created'), self.timezone),
-                        url=row.get('origin_url'), name=row.get('password_element'),
-                        value=password, count=row.get('times_used'),
-                        interpretation='User chose to save the credentials entered')
-                    password_row.row_type = 'login (password)'
-                    results.append(password_row)
+                        username_row.row_type = 'login (saved credentials)'
+                        append_result(username_row)
+
+                        # 'date_last_used' was added in v78; some older records may have small, invalid values;
+                        # skip them.
+                        date_last_used = row.get('date_last_used')
+                        if date_last_used and int(date_last_used) > 13100000000000000:
+                            interpretation_str = \
+                                'User tried to log in with this username (may or may not have succeeded)'
+                            if times_used and times_used > 0:
+                                interpretation_str += f'; times used: {times_used})'
+
+                            username_row = LoginItem(
+                                profile_path, cached_to_datetime(date_last_used, timezone),
+                                url=origin_url, name=row.get('username_element'),
+                                value=username_value, count=times_used,
+                                interpretation=interpretation_str)
+                            username_row.row_type = 'login (username)'
+                            append_result(username_row)
+
+                    password_value = row.get('password_value')
+                    if password_value is not None and self.available_decrypts['windows'] == 1:
+                        try:
+                            # Windows is all I've had time to test; Ubuntu uses built-in password manager
+                            password = win32crypt.CryptUnprotectData(password_value, None, None, None, 0)[1]
+                        except:
+                            password = self.decrypt_cookie(password_value)
 
-            conn.close()
+                        password_row = LoginItem(
+                            profile_path, date_created,
+                            url=origin_url, name=row.get('password_element'),
+                            value=password, count=times_used,
+                            interpretation='User chose to save the credentials entered')
+                        password_row.row_type = 'login (password)'
+                        append_result(password_row)
 
             # Queries for "stats" table for different versions
             query = {48: '''SELECT origin_domain, username_value, dismissal_count, update_time FROM stats'''}
 
-            # Get the lowest possible version from the version list, and decrement it until it finds a matching query
-            compatible_version = version[0]
-            while compatible_version not in list(query.keys()) and compatible_version > 0:
-                compatible_version -= 1
+            # Get the lowest possible version from the version list, and find the newest query that applies to it
+            compatible_version = utils.get_compatible_version(query, version[0])
 
             if compatible_version != 0:
                 log.info(f' - Using SQL query for Login Stat items for Chrome v{compatible_version}')
 
-                # Copy and connect to copy of 'Login Data' SQLite DB
-                conn = utils.open_sqlite_db(self, path, database)
-                if not conn:
-                    self.artifacts_counts[database] = 'Failed'
-                    return
+                # Reuse the connection to 'Login Data' from above, rather than copying and opening it again
                 cursor = conn.cursor()
 
                 # Use the highest compatible version SQL to select download data
                 cursor.execute(query[compatible_version])
 
-                for row in cursor:
-                    stats_row = Chrome.LoginItem(
-                        self.profile_path, utils.to_datetime(row.get('update_time'), self.timezone),
+                # The stats table only has a row per declined site, so fetch it all at once
+                for row in cursor.fetchall():
+                    dismissal_count = row.get('dismissal_count')
+                    stats_row = LoginItem(
+                        profile_path, cached_to_datetime(row.get('update_time'), timezone),
                         url=row.get('origin_domain'), name='',
-                        value=row.get('username_value'), count=row.get('dismissal_count'),
+                        value=row.get('username_value'), count=dismissal_count,
                         interpretation=f'User declined to save the password for this site '
-                                       f'(dismissal count: {row.get("dismissal_count")})')
+                                       f'(dismissal count: {dismissal_count})')
                     stats_row.row_type = 'login (declined save)'
-                    results.append(stats_row)
-                conn.close()
+                    append_result(stats_row)
+
+            conn.close()
 
         self.artifacts_counts['Login Data'] = len(results)
         log.info(f' - Parsed {len(results)} items')
@@ -840,10 +1222,8 @@ class Chrome(WebBrowser):
                  2: '''SELECT autofill_dates.date_created, autofill.name, autofill.value, autofill.count
                         FROM autofill, autofill_dates WHERE autofill.pair_id = autofill_dates.pair_id'''}
 
-        # Get the lowest possible version from the version list, and decrement it until it finds a matching query
-        compatible_version = version[0]
-        while compatible_version not in list(query.keys()) and compatible_version > 0:
-            compatible_version -= 1
+        # Get the lowest possible version from the version list, and find the newest query that applies to it
+        compatible_version = utils.get_compatible_version(query, version[0])
 
         if compatible_version != 0:
             log.info(f' - Using SQL query for Autofill items for Chrome v{compatible_version}')
@@ -858,19 +1238,28 @@ class Chrome(WebBrowser):
                 # Use highest compatible version SQL to select download data
                 cursor.execute(query[compatible_version])
 
-                for row in cursor:
-                    autofill_value = row.get('value')
-                    if isinstance(autofill_value, bytes):
-                        autofill_value = '<encrypted>'
-
-                    results.append(Chrome.AutofillItem(
-                        self.profile_path, utils.to_datetime(row.get('date_created'), self.timezone),
-                        row.get('name'), autofill_value, row.get('count')))
-
-                    if row.get('date_last_used') and row.get('count') > 1:
-                        results.append(Chrome.AutofillItem(
-                            self.profile_path, utils.to_datetime(row.get('date_last_used'), self.timezone),
-                            row.get('name'), autofill_value, row.get('count')))
+                profile_path = self.profile_path
+                timezone = self.timezone
+                AutofillItem = Chrome.AutofillItem
+                append_result = results.append
+                cursor.arraysize = 1000
+                while rows := cursor.fetchmany():
+                    for row in rows:
+                        autofill_name = row.get('name')
+                        autofill_count = row.get('count')
+                        autofill_value = row.get('value')
+                        if isinstance(autofill_value, bytes):
+                            autofill_value = '<encrypted>'
+
+                        append_result(AutofillItem(
+                            profile_path, cached_to_datetime(row.get('date_created'), timezone),
+                            autofill_name, autofill_value, autofill_count))
+
+                        date_last_used = row.get('date_last_used')
+                        if date_last_used and autofill_count > 1:
+                            append_result(AutofillItem(
+                                profile_path, cached_to_datetime(date_last_used, timezone),
+                                autofill_name, autofill_value, autofill_count))
 
                 conn.close()
                 self.artifacts_counts['Autofill'] = len(results)
@@ -898,10 +1287,8 @@ class Chrome(WebBrowser):
                            last_web_authn_assertion_time
                         FROM bounces'''}
 
-        # Get the lowest possible version from the version list, and decrement it until it finds a matching query
-        compatible_version = version[0]
-        while compatible_version not in list(query.keys()) and compatible_version > 0:
-            compatible_version -= 1
+        # Get the lowest possible version from the version list, and find the newest query that applies to it
+        compatible_version = utils.get_compatible_version(query, version[0])
 
         if compatible_version != 0:
             log.info(f' - Using SQL query for DIPS items for Chrome v{compatible_version}')
@@ -950,10 +1337,8 @@ class Chrome(WebBrowser):
         # Queries for different versions
         query = {117: '''SELECT opener_site, popup_site, last_popup_time FROM popups'''}
 
-        # Get the lowest possible version from the version list, and decrement it until it finds a matching query
-        compatible_version = version[0]
-        while compatible_version not in list(query.keys()) and compatible_version > 0:
-            compatible_version -= 1
+        # Get the lowest possible version from the version list, and find the newest query that applies to it
+        compatible_version = utils.get_compatible_version(query, version[0])
 
         if compatible_version != 0:
             log.info(f' - Using SQL query for DIPS items for Chrome v{compatible_version}')
@@ -995,25 +1380,34 @@ class Chrome(WebBrowser):
         bookmarks_path = os.path.join(path, file)
 
         try:
-            with open(bookmarks_path, encoding='utf-8', errors='replace') as f:
-                decoded_json = json.loads(f.read())
+            decoded_json = utils.read_json_file(bookmarks_path)
 
             log.info(f' - Reading from file "{bookmarks_path}"')
 
             # TODO: sync_id
             def process_bookmark_children(parent, children):
-                for child in children:
-                    if child['type'] == 'url':
-                        results.append(Chrome.BookmarkItem(
-                            self.profile_path, utils.to_datetime(child['date_added'], self.timezone),
-                            child['name'], child['url'], parent))
-                        
-                    elif child['type'] == 'folder':
-                        new_parent = parent + ' > ' + child['name']
-                        results.append(Chrome.BookmarkFolderItem(
-                            self.profile_path, utils.to_datetime(child['date_added'], self.timezone),
-                            child['date_modified'], child['name'], parent))
-                        process_bookmark_children(new_parent, child['children'])
+                # Walk the folder tree with an explicit stack rather than recursing into each folder. Each entry
+                # is a folder's path and an iterator over its remaining children, so items are still appended in
+                # the same (depth-first) order.
+                profile_path = self.profile_path
+                timezone = self.timezone
+                stack = [(parent, iter(children))]
+                while stack:
+                    parent, children = stack[-1]
+                    for child in children:
+                        if child['type'] == 'url':
+                            results.append(Chrome.BookmarkItem(
+                                profile_path, utils.to_datetime(child['date_added'], timezone),
+                                child['name'], child['url'], parent))
+
+                        elif child['type'] == 'folder':
+                            results.append(Chrome.BookmarkFolderItem(
+                                profile_path, utils.to_datetime(child['date_added'], timezone),
+                                child['date_modified'], child['name'], parent))
+                            stack.append((parent + ' > ' + child['name'], iter(child['children'])))
+                            break
+                    else:
+                        stack.pop()
 
             for top_level_folder in list(decoded_json['roots'].keys()):
                 if top_level_folder == 'synced':
@@ -1042,29 +1436,38 @@ class Chrome(WebBrowser):
         log.info('Local Storage:')
         log.info(f' - Reading from {ls_path}')
 
-        local_storage_listing = os.listdir(ls_path)
+        with os.scandir(ls_path) as ls_dir:
+            local_storage_listing = list(ls_dir)
         log.debug(f' - {len(local_storage_listing)} files in Local Storage directory')
         filtered_listing = []
 
         # Chrome v61+ used leveldb for LocalStorage, but kept old SQLite .localstorage files if upgraded.
-        if 'leveldb' in local_storage_listing:
+        if any(ls_entry.name == 'leveldb' for ls_entry in local_storage_listing):
             log.debug(' - Found "leveldb" directory; reading Local Storage LevelDB records')
             ls_ldb_path = os.path.join(ls_path, 'leveldb')
-            ls_ldb_records = utils.get_ldb_records(ls_ldb_path)
-            log.debug(f' - Reading {len(ls_ldb_records)} Local Storage raw LevelDB records; beginning parsing')
-            for record in ls_ldb_records:
-                ls_item = self.parse_ls_ldb_record(record)
+            # Parse the records as they are read, rather than holding every raw record in memory first. Only
+            # entry records (keys starting with '_') are kept, so skip parsing the META and VERSION ones at all.
+            profile_path = self.profile_path
+            parse_ls_ldb_record = self.parse_ls_ldb_record
+            record_count = 0
+            for record in utils.iter_ldb_records(ls_ldb_path):
+                record_count += 1
+                if not record['key'].startswith(b'_'):
+                    continue
+                ls_item = parse_ls_ldb_record(record)
                 if ls_item and ls_item.get('record_type') == 'entry':
                     results.append(Chrome.LocalStorageItem(
-                        self.profile_path, ls_item['origin'], ls_item['key'], ls_item['value'],
+                        profile_path, ls_item['origin'], ls_item['key'], ls_item['value'],
                         ls_item['seq'], ls_item['state'], str(ls_item['origin_file'])))
+            log.debug(f' - Parsed {record_count} Local Storage raw LevelDB records')
 
         # Chrome v60 and earlier used a SQLite file (with a .localstorage file ext) for each origin
-        for ls_file in local_storage_listing:
+        for ls_entry in local_storage_listing:
+            ls_file = ls_entry.name
             if ls_file.startswith(('ftp', 'http', 'file', 'chrome-extension')) and ls_file.endswith('.localstorage'):
                 filtered_listing.append(ls_file)
-                ls_file_path = os.path.join(ls_path, ls_file)
-                ls_created = os.stat(ls_file_path).st_ctime
+                ls_file_path = ls_entry.path
+                ls_created = ls_entry.stat().st_ctime
 
                 try:
                     # Copy and connect to copy of the Local Storage SQLite DB
@@ -1072,17 +1475,20 @@ class Chrome(WebBrowser):
                     cursor = conn.cursor()
 
                     cursor.execute('SELECT key,value,rowid FROM ItemTable')
-                    for row in cursor:
-                        try:
-                            printable_value = row.get('value', b'').decode('utf-16')
-                        except:
-                            printable_value = repr(row.get('value'))
+                    cursor.arraysize = 1000
+                    while rows := cursor.fetchmany():
+                        for row in rows:
+                            ls_value = row.get('value', b'')
+                            try:
+                                printable_value = ls_value.decode('utf-16')
+                            except:
+                                printable_value = repr(ls_value)
 
-                        results.append(Chrome.LocalStorageItem(
-                            profile=self.profile_path, origin=ls_file[:-13], key=row.get('key', ''),
-                            value=printable_value, seq=row.get('rowid', 0), state='Live',
-                            last_modified=utils.to_datetime(ls_created, self.timezone),
-                            source_path=os.path.join(ls_path, ls_file)))
+                            results.append(Chrome.LocalStorageItem(
+                                profile=self.profile_path, origin=ls_file[:-13], key=row.get('key', ''),
+                                value=printable_value, seq=row.get('rowid', 0), state='Live',
+                                last_modified=utils.to_datetime(ls_created, self.timezone),
+                                source_path=os.path.join(ls_path, ls_file)))
 
                     conn.close()
 
@@ -1206,122 +1612,133 @@ class Chrome(WebBrowser):
         log.info(f' - Parsed {len(results)} items from {len(idb_storage_listing)} files')
         self.parsed_storage.extend(results)
 
-    def get_extensions(self, path, dir_name):
-        results = []
-        log.info('Extensions:')
+    @staticmethod
+    def get_extension_message(locale_messages, message_name, fallback_message_name):
+        """Look up a localized extension string (like __MSG_appName__) in the decoded messages.json.
+
+        Chrome matches message names case-insensitively, so the lowercase name is tried next. Some extensions
+        (Google Wallet / Chrome Payments is weird/hidden) store the string under a different name, so
+        fallback_message_name is tried last. Returns None if none of them are found.
+        """
+        for key in (message_name, message_name.lower(), fallback_message_name):
+            try:
+                return locale_messages[key]['message']
+            except (KeyError, TypeError):
+                continue
+        return None
+
+    def _parse_extension(self, ext_path, app_id):
+        """Read the manifest (and localized messages, if needed) for the extension in ext_path/app_id.
+
+        This runs in a worker thread, so rather than logging directly, messages are collected and returned
+        (as (level, message) tuples) with the BrowserExtension (or None), for get_extensions to log in order.
+        """
+        messages = []
 
         # Profile folder
         try:
-            profile = os.path.split(path)[1]
+            profile = os.path.split(os.path.dirname(ext_path))[1]
         except:
             profile = 'error'
 
-        # Grab listing of 'Extensions' directory
-        ext_path = os.path.join(path, dir_name)
-        log.info(f' - Reading from {ext_path}')
-        ext_listing = os.listdir(ext_path)
-        log.debug(f' - {len(ext_listing)} files in Extensions directory: {str(ext_listing)}')
+        # Get listing of the contents of app_id directory; should contain subdirs for each version of the extension.
+        ext_vers_listing = os.path.join(ext_path, app_id)
+        ext_vers = os.listdir(ext_vers_listing)
+        selected_version = None
+        decoded_manifest = None
 
-        # Only process directories with the expected naming convention
-        app_id_re = re.compile(r'^([a-z]{32})$')
-        ext_listing = [str(x) for x in ext_listing if app_id_re.match(x)]
-        log.debug(f' - {len(ext_listing)} files in Extensions directory will be processed: {str(ext_listing)}')
-
-        # Process each directory with an app_id name
-        for app_id in ext_listing:
-            # Get listing of the contents of app_id directory; should contain subdirs for each version of the extension.
-            ext_vers_listing = os.path.join(ext_path, app_id)
-            ext_vers = os.listdir(ext_vers_listing)
-            manifest_file = None
-            selected_version = None
-            decoded_manifest = None
+        try:
+            # Connect to manifest.json in the latest version directory
+            for version in sorted(ext_vers, reverse=True, key=extension_version_key):
+                manifest_path = os.path.join(ext_vers_listing, version, 'manifest.json')
+                try:
+                    decoded_manifest = utils.read_json_file(manifest_path)
+                    selected_version = version
+                    break
+                except (IOError, json.JSONDecodeError) as e:
+                    messages.append((logging.ERROR, f' - Error opening {manifest_path} for extension {app_id}; {e}'))
+                    continue
 
-            try:
-                # Connect to manifest.json in the latest version directory
-                for version in sorted(ext_vers, reverse=True, key=lambda x: int(x.split('.', maxsplit=1)[0])):
-                    manifest_path = os.path.join(ext_vers_listing, version, 'manifest.json')
-                    try:
-                        with open(manifest_path, encoding='utf-8', errors='replace') as f:
-                            decoded_manifest = json.loads(f.read())
-                        selected_version = version
-                        break
-                    except (IOError, json.JSONDecodeError) as e:
-                        log.error(f' - Error opening {manifest_path} for extension {app_id}; {e}')
-                        continue
+            if not decoded_manifest:
+                messages.append((logging.ERROR, f' - Error opening manifest info for extension {app_id}'))
+                return None, messages
 
-                if not decoded_manifest:
-                    log.error(f' - Error opening manifest info for extension {app_id}')
-                    continue
+            name = None
+            description = None
 
-                name = None
-                description = None
+        except Exception as e:
+            messages.append((logging.ERROR, f' - Error reading manifest info for extension {app_id}; {e}'))
+            return None, messages
 
-            except Exception as e:
-                log.error(f' - Error reading manifest info for extension {app_id}; {e}')
-                continue
+        try:
+            # The name and description are often both localized, so read messages.json (at most once) for both
+            decoded_locale_messages = None
+            if decoded_manifest.get('default_locale') and (
+                    decoded_manifest['name'].startswith('__') or
+                    decoded_manifest.get('description', '').startswith('__')):
+                decoded_locale_messages = utils.read_json_file(os.path.join(
+                    ext_vers_listing, selected_version, '_locales', decoded_manifest['default_locale'],
+                    'messages.json'))
+
+            if decoded_manifest['name'].startswith('__'):
+                if decoded_manifest['default_locale']:
+                    name = self.get_extension_message(
+                        decoded_locale_messages, decoded_manifest['name'][6:-2], 'app_name')
+                    if name is None:
+                        messages.append((logging.WARNING, f' - Error reading \'name\' for {app_id}'))
+                        name = '<error>'
+            else:
+                try:
+                    name = decoded_manifest['name']
+                except KeyError:
+                    name = None
+                    messages.append((logging.ERROR, f' - Error reading \'name\' for {app_id}'))
 
-            try:
-                if decoded_manifest['name'].startswith('__'):
+            if 'description' in decoded_manifest:
+                if decoded_manifest['description'].startswith('__'):
                     if decoded_manifest['default_locale']:
-                        locale_messages_path = os.path.join(
-                            ext_vers_listing, selected_version, '_locales', decoded_manifest['default_locale'],
-                            'messages.json')
-                        with open(locale_messages_path, encoding='utf-8', errors='replace') as f:
-                            decoded_locale_messages = json.loads(f.read())
-
-                        try:
-                            name = decoded_locale_messages[decoded_manifest['name'][6:-2]]['message']
-                        except KeyError:
-                            try:
-                                name = decoded_locale_messages[decoded_manifest['name'][6:-2]].lower['message']
-                            except KeyError:
-                                try:
-                                    # Google Wallet / Chrome Payments is weird/hidden - name is saved different
-                                    # than other extensions
-                                    name = decoded_locale_messages['app_name']['message']
-                                except:
-                                    log.warning(f' - Error reading \'name\' for {app_id}')
-                                    name = '<error>'
+                        description = self.get_extension_message(
+                            decoded_locale_messages, decoded_manifest['description'][6:-2], 'app_description')
+                        if description is None:
+                            description = '<error>'
+                            messages.append((logging.ERROR, f' - Error reading \'message\' for {app_id}'))
                 else:
                     try:
-                        name = decoded_manifest['name']
+                        description = decoded_manifest['description']
                     except KeyError:
-                        name = None
-                        log.error(f' - Error reading \'name\' for {app_id}')
-
-                if 'description' in list(decoded_manifest.keys()):
-                    if decoded_manifest['description'].startswith('__'):
-                        if decoded_manifest['default_locale']:
-                            locale_messages_path = os.path.join(
-                                ext_vers_listing, selected_version, '_locales', decoded_manifest['default_locale'],
-                                'messages.json')
-                            with open(locale_messages_path, encoding='utf-8', errors='replace') as f:
-                                decoded_locale_messages = json.loads(f.read())
+                        description = None
+                        messages.append((logging.WARNING, f' - Error reading \'description\' for {app_id}'))
 
-                            try:
-                                description = decoded_locale_messages[decoded_manifest['description'][6:-2]]['message']
-                            except KeyError:
-                                try:
-                                    description = decoded_locale_messages[
-                                        decoded_manifest['description'][6:-2]].lower['message']
-                                except KeyError:
-                                    try:
-                                        # Google Wallet / Chrome Payments is weird/hidden - name is saved different
-                                        # from other extensions
-                                        description = decoded_locale_messages['app_description']['message']
-                                    except:
-                                        description = '<error>'
-                                        log.error(f' - Error reading \'message\' for {app_id}')
-                    else:
-                        try:
-                            description = decoded_manifest['description']
-                        except KeyError:
-                            description = None
-                            log.warning(f' - Error reading \'description\' for {app_id}')
+            return Chrome.BrowserExtension(profile, app_id, name, description, decoded_manifest['version']), messages
+        except:
+            messages.append((logging.ERROR, f' - Error decoding manifest file for {app_id}'))
+            return None, messages
 
-                results.append(Chrome.BrowserExtension(profile, app_id, name, description, decoded_manifest['version']))
-            except:
-                log.error(f' - Error decoding manifest file for {app_id}')
+    def get_extensions(self, path, dir_name):
+        results = []
+        log.info('Extensions:')
+
+        # Grab listing of 'Extensions' directory
+        ext_path = os.path.join(path, dir_name)
+        log.info(f' - Reading from {ext_path}')
+        with os.scandir(ext_path) as ext_dir:
+            ext_entries = list(ext_dir)
+        log.debug(f' - {len(ext_entries)} files in Extensions directory: {str([x.name for x in ext_entries])}')
+
+        # Only process directories with the expected naming convention
+        ext_listing = [x.name for x in ext_entries if x.is_dir() and EXTENSION_APP_ID_RE.fullmatch(x.name)]
+        log.debug(f' - {len(ext_listing)} files in Extensions directory will be processed: {str(ext_listing)}')
+
+        # Reading each extension's manifest (and messages) is mostly waiting on file I/O, so work through them in
+        # a thread pool. map() returns the results in the same order as ext_listing, so each extension's log
+        # messages are written together, in that order, rather than interleaved between threads.
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            for extension, messages in executor.map(
+                    functools.partial(self._parse_extension, ext_path), ext_listing):
+                for level, message in messages:
+                    log.log(level, message)
+                if extension is not None:
+                    results.append(extension)
 
         self.artifacts_counts['Extensions'] = len(results)
         log.info(f' - Parsed {len(results)} items')
@@ -1354,7 +1771,7 @@ class Chrome(WebBrowser):
                     if not value:
                         value = parent[pref]
                     # Append the preference dict to our results array
-                    results.append({
+                    append_result({
                         'group': None,
                         'name': pref,
                         'value': value,
@@ -1362,7 +1779,7 @@ class Chrome(WebBrowser):
                     })
 
                 else:
-                    results.append({
+                    append_result({
                         'group': None,
                         'name': pref,
                         'value': '<not present>',
@@ -1379,7 +1796,7 @@ class Chrome(WebBrowser):
                 if not value:
                     value = parent[pref]
                 # Append the preference dict to our results array
-                results.append({
+                append_result({
                     'group': None,
                     'name': pref,
                     'value': value,
@@ -1387,7 +1804,7 @@ class Chrome(WebBrowser):
                 })
 
             else:
-                results.append({
+                append_result({
                     'group': None,
                     'name': pref,
                     'value': '<not present>',
@@ -1396,7 +1813,7 @@ class Chrome(WebBrowser):
 
         def append_group(group, description=None):
             # Append the preference group to our results array
-            results.append({
+            append_result({
                 'group': group,
                 'name': None,
                 'value': None,
@@ -1404,141 +1821,39 @@ class Chrome(WebBrowser):
             })
 
         def append_pref(pref, value=None, description=None):
-            results.append({
+            append_result({
                 'group': None,
                 'name': pref,
                 'value': value,
                 'description': description
             })
 
-        def expand_language_code(code):
-            # From https://cs.chromium.org/chromium/src/components/translate/core/browser/translate_language_list.cc
-            codes = {
-                  'af': 'Afrikaans',
-                  'am': 'Amharic',
-                  'ar': 'Arabic',
-                  'az': 'Azerbaijani',
-                  'be': 'Belarusian',
-                  'bg': 'Bulgarian',
-                  'bn': 'Bengali',
-                  'bs': 'Bosnian',
-                  'ca': 'Catalan',
-                  'ceb': 'Cebuano',
-                  'co': 'Corsican',
-                  'cs': 'Czech',
-                  'cy': 'Welsh',
-                  'da': 'Danish',
-                  'de': 'German',
-                  'el': 'Greek',
-                  'en': 'English',
-                  'eo': 'Esperanto',
-                  'es': 'Spanish',
-                  'et': 'Estonian',
-                  'eu': 'Basque',
-                  'fa': 'Persian',
-                  'fi': 'Finnish',
-                  'fy': 'Frisian',
-                  'fr': 'French',
-                  'ga': 'Irish',
-                  'gd': 'Scots Gaelic',
-                  'gl': 'Galician',
-                  'gu': 'Gujarati',
-                  'ha': 'Hausa',
-                  'haw': 'Hawaiian',
-                  'hi': 'Hindi',
-                  'hr': 'Croatian',
-                  'ht': 'Haitian Creole',
-                  'hu': 'Hungarian',
-                  'hy': 'Armenian',
-                  'id': 'Indonesian',
-                  'ig': 'Igbo',
-                  'is': 'Icelandic',
-                  'it': 'Italian',
-                  'iw': 'Hebrew',
-                  'ja': 'Japanese',
-                  'ka': 'Georgian',
-                  'kk': 'Kazakh',
-                  'km': 'Khmer',
-                  'kn': 'Kannada',
-                  'ko': 'Korean',
-                  'ku': 'Kurdish',
-                  'ky': 'Kyrgyz',
-                  'la': 'Latin',
-                  'lb': 'Luxembourgish',
-                  'lo': 'Lao',
-                  'lt': 'Lithuanian',
-                  'lv': 'Latvian',
-                  'mg': 'Malagasy',
-                  'mi': 'Maori',
-                  'mk': 'Macedonian',
-                  'ml': 'Malayalam',
-                  'mn': 'Mongolian',
-                  'mr': 'Marathi',
-                  'ms': 'Malay',
-                  'mt': 'Maltese',
-                  'my': 'Burmese',
-                  'ne': 'Nepali',
-                  'nl': 'Dutch',
-                  'no': 'Norwegian',
-                  'ny': 'Nyanja',
-                  'pa': 'Punjabi',
-                  'pl': 'Polish',
-                  'ps': 'Pashto',
-                  'pt': 'Portuguese',
-                  'ro': 'Romanian',
-                  'ru': 'Russian',
-                  'sd': 'Sindhi',
-                  'si': 'Sinhala',
-                  'sk': 'Slovak',
-                  'sl': 'Slovenian',
-                  'sm': 'Samoan',
-                  'sn': 'Shona',
-                  'so': 'Somali',
-                  'sq': 'Albanian',
-                  'sr': 'Serbian',
-                  'st': 'Southern Sotho',
-                  'su': 'Sundanese',
-                  'sv': 'Swedish',
-                  'sw': 'Swahili',
-                  'ta': 'Tamil',
-                  'te': 'Telugu',
-                  'tg': 'Tajik',
-                  'th': 'Thai',
-                  'tl': 'Tagalog',
-                  'tr': 'Turkish',
-                  'uk': 'Ukrainian',
-                  'ur': 'Urdu',
-                  'uz': 'Uzbek',
-                  'vi': 'Vietnamese',
-                  'yi': 'Yiddish',
-                  'xh': 'Xhosa',
-                  'yo': 'Yoruba',
-                  'zh-CN': 'Chinese (Simplified)',
-                  'zh-TW': 'Chinese (Traditional)',
-                  'zu': 'Zulu'
-                }
-            return codes.get(code, code)
-
         results = []
+        append_result = results.append
         timestamped_preference_items = []
+        append_timestamped_item = timestamped_preference_items.append
         log.info('Preferences:')
 
         # Open 'Preferences' file
         pref_path = os.path.join(path, preferences_file)
+        log.info(f' - Reading from {pref_path}')
+        if not os.path.isfile(pref_path):
+            log.info(f'   - Failed; {preferences_file} does not exist in {path}')
+            self.artifacts_counts[preferences_file] = 'Failed'
+            return
+
         try:
-            log.info(f' - Reading from {pref_path}')
-            with open(pref_path, encoding='utf-8', errors='replace') as f:
-                prefs = json.loads(f.read())
+            prefs = utils.read_json_file(pref_path)
 
-        except Exception as e:
+        except (OSError, ValueError) as e:
             log.exception(f' - Error decoding Preferences file {pref_path}: {e}')
             self.artifacts_counts[preferences_file] = 'Failed'
             return
 
         # Account Information
-        if prefs.get('account_info'):
+        if account_info := prefs.get('account_info'):
             append_group('Account Information')
-            for account in prefs['account_info']:
+            for account in account_info:
                 for account_item in list(account.keys()):
                     if account_item == 'accountcapabilities':
                         continue
@@ -1546,23 +1861,23 @@ class Chrome(WebBrowser):
 
         # Local file paths
         append_group('Local file paths')
-        if prefs.get('download'):
-            check_and_append_pref(prefs['download'], 'default_directory')
+        if download := prefs.get('download'):
+            check_and_append_pref(download, 'default_directory')
         if prefs.get('printing'):
             if prefs.get('print_preview_sticky_settings'):
                 check_and_append_pref(prefs['printing']['print_preview_sticky_settings'], 'savePath')
-        if prefs.get('savefile'):
-            check_and_append_pref(prefs['savefile'], 'default_directory')
-        if prefs.get('selectfile'):
-            check_and_append_pref(prefs['selectfile'], 'last_directory')
+        if savefile := prefs.get('savefile'):
+            check_and_append_pref(savefile, 'default_directory')
+        if selectfile := prefs.get('selectfile'):
+            check_and_append_pref(selectfile, 'last_directory')
 
         # Autofill
-        if prefs.get('autofill'):
+        if autofill := prefs.get('autofill'):
             append_group('Autofill')
-            check_and_append_pref(prefs['autofill'], 'enabled')
+            check_and_append_pref(autofill, 'enabled')
 
         # Network Prediction
-        if prefs.get('net'):
+        if net := prefs.get('net'):
             # Ref: https://source.chromium.org/chromium/chromium/src/+/main:chrome/browser/net/prediction_options.h
             NETWORK_PREDICTION_OPTIONS = {
                 0: 'Always',
@@ -1570,31 +1885,30 @@ class Chrome(WebBrowser):
                 2: 'Never'
             }
             append_group('Network Prefetching')
-            check_and_append_pref(prefs['net'], 'network_prediction_options',
-                                  NETWORK_PREDICTION_OPTIONS.get(prefs['net'].get('network_prediction_options')))
+            check_and_append_pref(net, 'network_prediction_options',
+                                  NETWORK_PREDICTION_OPTIONS.get(net.get('network_prediction_options')))
 
         # Clearing Chrome Data
-        if prefs.get('browser'):
+        if browser := prefs.get('browser'):
             append_group('Clearing Chrome Data')
-            if prefs['browser'].get('last_clear_browsing_data_time'):
+            if last_clear_browsing_data_time := browser.get('last_clear_browsing_data_time'):
                 check_and_append_pref(
-                    prefs['browser'], 'last_clear_browsing_data_time',
-                    utils.friendly_date(prefs['browser']['last_clear_browsing_data_time']),
+                    browser, 'last_clear_browsing_data_time', utils.friendly_date(last_clear_browsing_data_time),
                     'Last time the history was cleared')
-            check_and_append_pref(prefs['browser'], 'clear_lso_data_enabled')
-            if prefs['browser'].get('clear_data'):
+            check_and_append_pref(browser, 'clear_lso_data_enabled')
+            if clear_data := browser.get('clear_data'):
                 try:
                     check_and_append_pref(
-                        prefs['browser']['clear_data'], 'time_period',
+                        clear_data, 'time_period',
                         description='0: past hour; 1: past day; 2: past week; 3: last 4 weeks; '
                                     '4: the beginning of time')
-                    check_and_append_pref(prefs['browser']['clear_data'], 'content_licenses')
-                    check_and_append_pref(prefs['browser']['clear_data'], 'hosted_apps_data')
-                    check_and_append_pref(prefs['browser']['clear_data'], 'cookies')
-                    check_and_append_pref(prefs['browser']['clear_data'], 'download_history')
-                    check_and_append_pref(prefs['browser']['clear_data'], 'browsing_history')
-                    check_and_append_pref(prefs['browser']['clear_data'], 'passwords')
-                    check_and_append_pref(prefs['browser']['clear_data'], 'form_data')
+                    check_and_append_pref(clear_data, 'content_licenses')
+                    check_and_append_pref(clear_data, 'hosted_apps_data')
+                    check_and_append_pref(clear_data, 'cookies')
+                    check_and_append_pref(clear_data, 'download_history')
+                    check_and_append_pref(clear_data, 'browsing_history')
+                    check_and_append_pref(clear_data, 'passwords')
+                    check_and_append_pref(clear_data, 'form_data')
                 except Exception as e:
                     log.exception(f' - Exception parsing Preference item: {e})')
 
@@ -1613,19 +1927,18 @@ class Chrome(WebBrowser):
 
         # There may be per_host_zoom_levels keys in at least two locations: profile.per_host_zoom_levels and
         # partition.per_host_zoom_levels. The "profile." location may have been deprecated; unsure.
-        if prefs.get('profile'):
-            if prefs['profile'].get('per_host_zoom_levels'):
+        if profile_prefs := prefs.get('profile'):
+            if per_host_zoom_levels := profile_prefs.get('per_host_zoom_levels'):
                 try:
-                    for zoom in list(prefs['profile']['per_host_zoom_levels'].keys()):
-                        check_and_append_pref(prefs['profile']['per_host_zoom_levels'], zoom,
-                                              zoom_level_to_zoom_factor(zoom))
+                    for host, zoom_level in per_host_zoom_levels.items():
+                        check_and_append_pref(per_host_zoom_levels, host, zoom_level_to_zoom_factor(zoom_level))
                 except Exception as e:
                     log.exception(f' - Exception parsing Preference item: {e})')
 
-        if prefs.get('partition'):
-            if prefs['partition'].get('per_host_zoom_levels'):
+        if partition := prefs.get('partition'):
+            if partition_zoom_levels := partition.get('per_host_zoom_levels'):
                 try:
-                    for partition_key, zoom_levels in list(prefs['partition']['per_host_zoom_levels'].items()):
+                    for partition_key, zoom_levels in partition_zoom_levels.items():
                         for host, config in zoom_levels.items():
                             if isinstance(config, float):
                                 # Example:
@@ -1637,101 +1950,116 @@ class Chrome(WebBrowser):
                                 #     "last_modified": "13252995901366133",
                                 #     "zoom_level": -0.5778829311823857
                                 #   }
-                                append_pref(host, zoom_level_to_zoom_factor(config.get('zoom_level')))
+                                zoom_factor = zoom_level_to_zoom_factor(config.get('zoom_level'))
+                                append_pref(host, zoom_factor)
                                 timestamped_preference_item = Chrome.SiteSetting(
                                     self.profile_path, url=host,
-                                    timestamp=utils.to_datetime(config.get('last_modified'), self.timezone),
+                                    timestamp=cached_to_datetime(config.get('last_modified'), self.timezone),
                                     key=f'per_host_zoom_levels [in {preferences_file}.partition]',
-                                    value=f'Changed zoom level to {zoom_level_to_zoom_factor(config.get("zoom_level"))}',
+                                    value=f'Changed zoom level to {zoom_factor}',
                                     interpretation='')
                                 timestamped_preference_item.row_type += ' (zoom level)'
-                                timestamped_preference_items.append(timestamped_preference_item)
+                                append_timestamped_item(timestamped_preference_item)
                 except Exception as e:
                     log.exception(f' - Exception parsing Preference item: {e})')
 
-        if prefs.get('password_manager'):
-            if prefs['password_manager'].get('profile_store_date_last_used_for_filling'):
+        if password_manager := prefs.get('password_manager'):
+            if last_used_for_filling := password_manager.get('profile_store_date_last_used_for_filling'):
                 timestamped_preference_item = Chrome.SiteSetting(
                     self.profile_path, url='',
-                    timestamp=utils.to_datetime(
-                        prefs['password_manager']['profile_store_date_last_used_for_filling'], self.timezone),
+                    timestamp=utils.to_datetime(last_used_for_filling, self.timezone),
                     key=f'profile_store_date_last_used_for_filling [in {preferences_file}.password_manager]',
-                    value=prefs['password_manager']['profile_store_date_last_used_for_filling'], interpretation='')
+                    value=last_used_for_filling, interpretation='')
                 timestamped_preference_item.row_type += ' (password fill)'
-                timestamped_preference_items.append(timestamped_preference_item)
+                append_timestamped_item(timestamped_preference_item)
 
-        if prefs.get('profile'):
-            if prefs['profile'].get('content_settings'):
-                if prefs['profile']['content_settings'].get('pattern_pairs'):
+        if profile_prefs:
+            if content_settings := profile_prefs.get('content_settings'):
+                if pattern_pairs := content_settings.get('pattern_pairs'):
                     try:
                         append_group('Profile Content Settings', 'These settings persist even when the history is '
                                                                  'cleared, and may be useful in some cases.')
-                        for pair in list(prefs['profile']['content_settings']['pattern_pairs'].keys()):
+                        for pair, pair_settings in pattern_pairs.items():
                             # Adding the space before the domain prevents Excel from freaking out...  idk.
-                            append_pref(' '+str(pair), str(prefs['profile']['content_settings']['pattern_pairs'][pair]))
+                            append_pref(' '+str(pair), str(pair_settings))
                     except Exception as e:
                         log.exception(f' - Exception parsing Preference item: {e})')
 
-                if prefs['profile']['content_settings'].get('exceptions'):
+                content_settings_exceptions = content_settings.get('exceptions')
+                if content_settings_exceptions:
+                    # The setting value can be an int that maps to an enum, or a dict for a more
+                    # complicated setting. If it's the simpler int value, translate the enum.
+                    content_settings_values = {
+                        0: 'default',
+                        1: 'allow',
+                        2: 'block'
+                    }
 
-                    for exception_type, exception_data in prefs['profile']['content_settings']['exceptions'].items():
+                    # These keys are the same for every origin, so build them once rather than per item
+                    exceptions_key_suffix = f'[in {preferences_file}.profile.content_settings.exceptions]'
+                    media_playback_key = f'lastMediaPlaybackTime in {preferences_file}.profile.' \
+                                         f'content_settings.exceptions.media_engagement]'
+                    engagement_key = f'lastEngagementTime in {preferences_file}.profile.' \
+                                     f'content_settings.exceptions.site_engagement]'
+
+                    for exception_type, exception_data in content_settings_exceptions.items():
+                        exception_key = f'{exception_type} {exceptions_key_suffix}'
+                        is_engagement_type = exception_type.endswith('_engagement')
                         try:
                             for origin, pref_data in exception_data.items():
-                                if pref_data.get('last_modified') and pref_data.get('last_modified') != '0':
+                                last_modified = pref_data.get('last_modified')
+                                is_modified = last_modified and last_modified != '0'
+                                if not (is_modified or is_engagement_type):
+                                    continue
+
+                                # Both the modified and engagement items carry the whole setting as their
+                                # value; stringify it once for the two of them.
+                                pref_data_str = str(pref_data)
+                                setting = pref_data.get('setting')
+                                if is_modified:
                                     row_type_suffix = ' (modified)'
                                     interpretation = ''
 
-                                    # The setting value can be an int that maps to an enum, or a dict for a more
-                                    # complicated setting. If it's the simpler int value, translate the enum.
-                                    content_settings_values = {
-                                        0: 'default',
-                                        1: 'allow',
-                                        2: 'block'
-                                    }
-
-                                    if isinstance(pref_data.get('setting'), int):
-                                        interpretation = f'"{exception_type}" set to {pref_data["setting"]} ' \
-                                                         f'({content_settings_values.get(pref_data["setting"])})'
+                                    if isinstance(setting, int):
+                                        interpretation = f'"{exception_type}" set to {setting} ' \
+                                                         f'({content_settings_values.get(setting)})'
 
                                     pref_item = Chrome.SiteSetting(
                                         self.profile_path, url=origin,
-                                        timestamp=utils.to_datetime(pref_data['last_modified'], self.timezone),
-                                        key=f'{exception_type} '
-                                            f'[in {preferences_file}.profile.content_settings.exceptions]',
-                                        value=str(pref_data), interpretation=interpretation)
+                                        timestamp=cached_to_datetime(last_modified, self.timezone),
+                                        key=exception_key,
+                                        value=pref_data_str, interpretation=interpretation)
                                     pref_item.row_type += row_type_suffix
-                                    timestamped_preference_items.append(pref_item)
+                                    append_timestamped_item(pref_item)
 
-                                if exception_type.endswith('_engagement'):
+                                if is_engagement_type:
                                     row_type_suffix = ' (engagement)'
-                                    media_playback_time = pref_data['setting'].get('lastMediaPlaybackTime', 0.0)
-                                    engagement_time = pref_data['setting'].get('lastEngagementTime', 0.0)
+                                    media_playback_time = setting.get('lastMediaPlaybackTime', 0.0)
+                                    engagement_time = setting.get('lastEngagementTime', 0.0)
 
                                     if media_playback_time:
                                         engagement_item = Chrome.SiteSetting(
                                             self.profile_path, url=origin,
-                                            timestamp=utils.to_datetime(media_playback_time, self.timezone),
-                                            key=f'lastMediaPlaybackTime in {preferences_file}.profile.'
-                                                f'content_settings.exceptions.media_engagement]',
-                                            value=str(pref_data), interpretation='')
+                                            timestamp=cached_to_datetime(media_playback_time, self.timezone),
+                                            key=media_playback_key,
+                                            value=pref_data_str, interpretation='')
                                         engagement_item.row_type += row_type_suffix
-                                        timestamped_preference_items.append(engagement_item)
+                                        append_timestamped_item(engagement_item)
 
                                     elif engagement_time:
                                         engagement_item = Chrome.SiteSetting(
                                             self.profile_path, url=origin,
-                                            timestamp=utils.to_datetime(engagement_time, self.timezone),
-                                            key=f'lastEngagementTime in {preferences_file}.profile.'
-                                                f'content_settings.exceptions.site_engagement]',
-                                            value=str(pref_data), interpretation='')
+                                            timestamp=cached_to_datetime(engagement_time, self.timezone),
+                                            key=engagement_key,
+                                            value=pref_data_str, interpretation='')
                                         engagement_item.row_type += row_type_suffix
-                                        timestamped_preference_items.append(engagement_item)
+                                        append_timestamped_item(engagement_item)
 
                         except Exception as e:
                             log.exception(f' - Exception parsing Preference item: {e})')
 
-        if prefs.get('extensions'):
-            if prefs['extensions'].get('autoupdate'):
+        if extensions := prefs.get('extensions'):
+            if autoupdate := extensions.get('autoupdate'):
                 # Example (from in Preferences file):
                 # "extensions": {
                 #     ...
@@ -1740,18 +2068,18 @@ class Chrome(WebBrowser):
                 #         "next_check": "13162686093672995"
                 #     },
                 try:
-                    if prefs['extensions']['autoupdate'].get('last_check'):
+                    if last_check := autoupdate.get('last_check'):
                         pref_item = Chrome.PreferenceItem(
                             self.profile_path, url='',
-                            timestamp=utils.to_datetime(prefs['extensions']['autoupdate']['last_check'], self.timezone),
+                            timestamp=utils.to_datetime(last_check, self.timezone),
                             key=f'autoupdate.last_check [in {preferences_file}.extensions]',
-                            value=prefs['extensions']['autoupdate']['last_check'], interpretation='')
-                        timestamped_preference_items.append(pref_item)
+                            value=last_check, interpretation='')
+                        append_timestamped_item(pref_item)
                 except Exception as e:
                     log.exception(f' - Exception parsing Preference item: {e})')
 
-        if prefs.get('sessions'):
-            if prefs['sessions'].get('event_log'):
+        if sessions := prefs.get('sessions'):
+            if session_event_log := sessions.get('event_log'):
                 # Source: https://source.chromium.org/chromium/chromium/src/
                 #  +/main:chrome/browser/sessions/session_service_log.h
                 session_types = {
@@ -1761,19 +2089,20 @@ class Chrome(WebBrowser):
                     3: 'Write Error (an error in writing the file occurred)'
                 }
 
-                for session_event in prefs['sessions']['event_log']:
+                session_event_key = f'Session event log [in {preferences_file}.sessions]'
+                for session_event in session_event_log:
                     pref_item = Chrome.PreferenceItem(
                         self.profile_path, url='',
-                        timestamp=utils.to_datetime(session_event['time'], self.timezone),
-                        key=f'Session event log [in {preferences_file}.sessions]',
+                        timestamp=cached_to_datetime(session_event['time'], self.timezone),
+                        key=session_event_key,
                         value=str(session_event),
                         interpretation=f'{session_event["type"]} - '
                                        f'{session_types.get(session_event["type"], "Unknown type")}')
                     pref_item.row_type += ' (session)'
-                    timestamped_preference_items.append(pref_item)
+                    append_timestamped_item(pref_item)
 
-        if prefs.get('signin'):
-            if prefs['signin'].get('signedin_time'):
+        if signin := prefs.get('signin'):
+            if signedin_time := signin.get('signedin_time'):
                 # Example (from in Preferences file):
                 # "signin": {
                 #     "signedin_time": "13196354823425155"
@@ -1781,36 +2110,35 @@ class Chrome(WebBrowser):
                 try:
                     pref_item = Chrome.PreferenceItem(
                         self.profile_path, url='',
-                        timestamp=utils.to_datetime(prefs['signin']['signedin_time'], self.timezone),
+                        timestamp=utils.to_datetime(signedin_time, self.timezone),
                         key=f'signedin_time [in {preferences_file}.signin]',
-                        value=prefs['signin']['signedin_time'], interpretation='')
-                    timestamped_preference_items.append(pref_item)
+                        value=signedin_time, interpretation='')
+                    append_timestamped_item(pref_item)
                 except Exception as e:
                     log.exception(f' - Exception parsing Preference item: {e})')
 
-        if prefs.get('sync'):
+        if sync := prefs.get('sync'):
             append_group('Sync Settings')
-            if prefs['sync'].get('last_poll_time'):
-                check_and_append_pref(prefs['sync'], 'last_poll_time',
-                                      utils.friendly_date(prefs['sync']['last_poll_time']))
+            if last_poll_time := sync.get('last_poll_time'):
+                check_and_append_pref(sync, 'last_poll_time', utils.friendly_date(last_poll_time))
 
-            if prefs['sync'].get('last_synced_time'):
-                check_and_append_pref(prefs['sync'], 'last_synced_time',
-                                      utils.friendly_date(prefs['sync']['last_synced_time']))
+            if last_synced_time := sync.get('last_synced_time'):
+                check_and_append_pref(sync, 'last_synced_time', utils.friendly_date(last_synced_time))
 
             sync_enabled_items = ['apps', 'autofill', 'bookmarks', 'cache_guid', 'extensions', 'gaia_id',
                                   'has_setup_completed', 'keep_everything_synced', 'passwords', 'preferences',
                                   'requested', 'tabs', 'themes', 'typed_urls']
 
-            for sync_pref in list(prefs['sync'].keys()):
+            for sync_pref in list(sync.keys()):
                 if sync_pref not in sync_enabled_items:
                     continue
 
-                check_and_append_pref(prefs['sync'], sync_pref)
+                check_and_append_pref(sync, sync_pref)
 
-        if prefs.get('translate_last_denied_time_for_language'):
+        if translate_last_denied_time := prefs.get('translate_last_denied_time_for_language'):
+            translate_key = f'translate_last_denied_time_for_language [in {preferences_file}]'
             try:
-                for lang_code, timestamp in prefs['translate_last_denied_time_for_language'].items():
+                for lang_code, timestamp in translate_last_denied_time.items():
                     # Example (from in Preferences file):
                     # "translate_last_denied_time_for_language": {
                     #   'ar': 1438733440742.06,
@@ -1821,11 +2149,12 @@ class Chrome(WebBrowser):
                         timestamp = timestamp[0]
                     assert isinstance(timestamp, float)
                     pref_item = Chrome.PreferenceItem(
-                        self.profile_path, url='', timestamp=utils.to_datetime(timestamp, self.timezone),
-                        key=f'translate_last_denied_time_for_language [in {preferences_file}]',
+                        self.profile_path, url='', timestamp=cached_to_datetime(timestamp, self.timezone),
+                        key=translate_key,
                         value=f'{lang_code}: {timestamp}',
-                        interpretation=f'Declined to translate page from {expand_language_code(lang_code)}')
-                    timestamped_preference_items.append(pref_item)
+                        interpretation=f'Declined to translate page from '
+                                       f'{TRANSLATE_LANGUAGE_CODES.get(lang_code, lang_code)}')
+                    append_timestamped_item(pref_item)
             except Exception as e:
                 log.exception(f' - Exception parsing Preference item: {e})')
 
@@ -1915,11 +2244,12 @@ class Chrome(WebBrowser):
             'state': record['state'],
             'origin_file': record['origin_file']
         }
+        key = record['key']
+        value = record['value']
 
-        if record['key'].startswith('META:'.encode('utf-8')):
+        if key.startswith(b'META:'):
             parsed['record_type'] = 'META'
-            parsed['origin'] = record['key'][5:].decode()
-            parsed['key'] = record['key'][5:].decode()
+            parsed['origin'] = parsed['key'] = key[5:].decode()
 
             # From https://cs.chromium.org/chromium/src/components/services/storage/dom_storage/
             #   local_storage_database.proto:
@@ -1927,83 +2257,76 @@ class Chrome(WebBrowser):
             #   required int64 last_modified = 1;
             #   required uint64 size_bytes = 2;
             # TODO: consider redoing this using protobufs
-            if record['value'].startswith(b'\x08'):
+            if value.startswith(b'\x08'):
                 ptr = 1
-                last_modified, bytes_read = utils.read_varint(record['value'][ptr:])
-                size_bytes, _ = utils.read_varint(record['value'][ptr + bytes_read:])
+                last_modified, bytes_read = utils.read_varint(value, ptr)
+                size_bytes, _ = utils.read_varint(value, ptr + bytes_read)
                 parsed['value'] = f'Last modified: {last_modified}; size: {size_bytes}'
             return parsed
 
-        elif record['key'] == b'VERSION':
+        elif key == b'VERSION':
             return
 
-        elif record['key'].startswith(b'_'):
+        elif key.startswith(b'_'):
             parsed['record_type'] = 'entry'
             try:
-                parsed['origin'], parsed['key'] = record['key'][1:].split(b'\x00', 1)
-                parsed['origin'] = parsed['origin'].decode()
+                origin, script_key = key[1:].split(b'\x00', 1)
+                parsed['origin'] = origin.decode()
 
-                if parsed['key'].startswith(b'\x01'):
-                    parsed['key'] = parsed['key'].lstrip(b'\x01').decode()
+                key_encoding = LS_KEY_ENCODINGS.get(script_key[0]) if script_key else None
+                if key_encoding:
+                    script_key = script_key.lstrip(script_key[:1]).decode(key_encoding)
 
-                elif parsed['key'].startswith(b'\x00'):
-                    parsed['key'] = parsed['key'].lstrip(b'\x00').decode('utf-16')
+                parsed['key'] = script_key
 
             except Exception as e:
                 log.error("Origin/key parsing error: {}".format(e))
                 return
 
             try:
-                if record['value'].startswith(b'\x01'):
-                    parsed['value'] = record['value'].lstrip(b'\x01').decode('utf-8', errors='replace')
-
-                elif record['value'].startswith(b'\x00'):
-                    parsed['value'] = record['value'].lstrip(b'\x00').decode('utf-16', errors='replace')
+                if value:
+                    value_encoding = LS_VALUE_ENCODINGS.get(value[0])
+                    if value_encoding:
+                        parsed['value'] = value.lstrip(value[:1]).decode(*value_encoding)
 
-                elif record['value'].startswith(b'\x08'):
-                    parsed['value'] = record['value'].lstrip(b'\x08').decode()
-
-                elif record['value'] == b'':
+                else:
                     parsed['value'] = ''
 
             except Exception as e:
                 log.error(f'Value parsing error: {e}')
                 return
 
-        for item in parsed.values():
-            assert not isinstance(item, bytes)
+        # Sanity check that no undecoded bytes are passed along; skipped when running with -O
+        if __debug__:
+            for item in parsed.values():
+                assert not isinstance(item, bytes)
 
         return parsed
 
-    def build_logical_fs_path(self, node, parent_path=None):
-        if not parent_path:
-            parent_path = []
-
-        parent_path.append(node['name'])
-        node['path'] = parent_path
-        for child_node in node['children'].values():
-            self.build_logical_fs_path(child_node, parent_path=list(node['path']))
-
-    def flatten_nodes_to_list(self, output_list, node):
-        output_row = {
-            'type': node['type'],
-            'origin': node['path'][0],
-            'logical_path': '\\'.join(node['path'][1:]),
-            'local_path': node['fs_path'],
-            'seq': node['seq'],
-            'state': node['state'],
-            'source_path': node['source_path'],
-            'file_exists': node.get('file_exists'),
-            'file_size': node.get('file_size'),
-            'magic_results': node.get('magic_results')
-        }
+    def iter_fs_items(self, root_node):
+        """Walk a File System node tree and yield a FileSystemItem for each node.
+
+        Nodes are visited depth-first, in their original order, using an explicit stack rather than recursion
+        so deep directory structures can't hit the recursion limit. Each node's logical path is a tuple
+        extended from its parent's as the tree is walked."""
+
+        nodes_to_visit = [(root_node, (root_node['name'],))]
+        while nodes_to_visit:
+            node, node_path = nodes_to_visit.pop()
 
-        if node.get('modification_time'):
-            output_row['modification_time'] = utils.to_datetime(node['modification_time'])
+            modification_time = node.get('modification_time')
+            yield Chrome.FileSystemItem(
+                profile=self.profile_path, origin=node_path[0], key='\\'.join(node_path[1:]),
+                value=node['fs_path'], seq=node['seq'], state=node['state'],
+                source_path=str(node['source_path']),
+                last_modified=cached_to_datetime(modification_time) if modification_time else None,
+                file_exists=node.get('file_exists'), file_size=node.get('file_size'),
+                magic_results=node.get('magic_results'))
 
-        output_list.append(output_row)
-        for child_node in node['children'].values():
-            self.flatten_nodes_to_list(output_list, child_node)
+            # Children are pushed in reverse, so they come off the stack in their original order
+            nodes_to_visit.extend(
+                (child_node, node_path + (child_node['name'],))
+                for child_node in reversed(node['children'].values()))
 
     @staticmethod
     def get_local_file_info(file_path):
@@ -2047,8 +2370,10 @@ class Chrome(WebBrowser):
                 origin_id = origin['value'].decode()
                 origin_root_path = os.path.join(fs_root_path, origin_id)
 
-                node_tree = {}
                 backing_files = {}
+                # Maps each node's key to its parent's key; used to link the tree together once
+                # all the nodes for this origin exist, as parents can appear after their children.
+                node_parents = {}
                 path_nodes = {
                     '0': {
                         'name': origin_domain, 'origin_id': origin_id, 'type': 'origin',
@@ -2058,12 +2383,20 @@ class Chrome(WebBrowser):
                     }
                 }
 
+                # List the origin's directory once, rather than checking for each storage section separately
+                try:
+                    with os.scandir(origin_root_path) as origin_dir:
+                        origin_subdirs = {entry.name for entry in origin_dir if entry.is_dir()}
+                except OSError:
+                    origin_subdirs = set()
+
                 # Each Origin can have a temporary (t) and persistent (p) storage section.
                 for fs_type in ['t', 'p']:
-                    fs_type_path = os.path.join(origin_root_path, fs_type)
-                    if not os.path.isdir(fs_type_path):
+                    if fs_type not in origin_subdirs:
                         continue
 
+                    fs_type_path = os.path.join(origin_root_path, fs_type)
+
                     log.debug(f' - Found \'{fs_type}\' data directory for origin {origin_domain}')
 
                     # Within each storage section is a 'Paths' leveldb, which holds the logical structure
@@ -2072,6 +2405,9 @@ class Chrome(WebBrowser):
                     if not os.path.isdir(fs_paths_path):
                         continue
 
+                    # Backing files are stored under this (relative) directory; join it once rather than per file
+                    fs_type_root = os.path.join(path_nodes['0']['fs_path'], fs_type)
+
                     # The 'Paths' ldbs can have entries of four different types:
                     # // - ("CHILD_OF:|parent_id|:<name>", "|file_id|"),
                     # // - ("LAST_FILE_ID", "|last_file_id|"),
@@ -2080,12 +2416,15 @@ class Chrome(WebBrowser):
                     # // where FileInfo has |parent_id|, |data_path|, |name| and |modification_time|
                     # from cs.chromium.org/chromium/src/storage/browser/file_system/sandbox_directory_database.cc
 
-                    path_items = utils.get_ldb_records(fs_paths_path)
+                    # Read through the records once, looking for "file_id" records to build backing_files dict.
+                    # We skip deleted records here, as deleted "file_id" records aren't useful. The "CHILD_OF"
+                    # records are set aside and handled below, as they might be out of order due to deletions.
+                    child_of_items = []
+                    for item in utils.iter_ldb_records(fs_paths_path):
+                        if item['key'].startswith(b'CHILD_OF:'):
+                            child_of_items.append(item)
+                            continue
 
-                    # Loop over records looking for "file_id" records to build backing_files dict. We skip
-                    # deleted records here, as deleted "file_id" records aren't useful. We'll loop over this
-                    # again below to get the "CHILD_OF" records, as they might be out of order due to deletions.
-                    for item in path_items:
                         # Deleted records have no value
                         if item['value'] == b'':
                             continue
@@ -2099,47 +2438,48 @@ class Chrome(WebBrowser):
                             name, ptr = utils.read_string(item['value'], ptr)
                             mod_time, ptr = utils.read_int64(item['value'], ptr)
 
-                            backing_files[item['key'].decode()] = {
+                            backing_file = backing_files[item['key'].decode()] = {
                                 'modification_time': mod_time,
                                 'seq': item['seq'],
                                 'state': item['state'],
                                 'source_path': item['origin_file']
                             }
 
-                            path_parts = re.split(r'[/\\]', backing_file_path)
+                            path_parts = backing_file_path.replace('\\', '/').split('/')
                             if path_parts != ['']:
-                                normalized_backing_file_path = os.path.join(
-                                    path_nodes['0']['fs_path'], fs_type, path_parts[0], path_parts[1])
+                                normalized_backing_file_path = os.path.join(fs_type_root, path_parts[0], path_parts[1])
                                 file_exists, file_size, magic_results = self.get_local_file_info(
                                            os.path.join(self.profile_path, normalized_backing_file_path))
-                                backing_files[item['key'].decode()]['file_exists'] = file_exists
-                                backing_files[item['key'].decode()]['file_size'] = file_size
-                                backing_files[item['key'].decode()]['magic_results'] = magic_results
+                                backing_file['file_exists'] = file_exists
+                                backing_file['file_size'] = file_size
+                                backing_file['magic_results'] = magic_results
 
                             else:
-                                normalized_backing_file_path = os.path.join(
-                                    path_nodes['0']['fs_path'], fs_type, backing_file_path)
-
-                            backing_files[item['key'].decode()]['backing_file_path'] = normalized_backing_file_path
-
-                    # Loop over records again, this time to add to the path_nodes dict (used later to construct
-                    # the logical path for items in FileSystem. We look at deleted records here; while the value
-                    # is empty, the key still exists and has useful info in it.
-                    for item in path_items:
-                        if not item['key'].startswith(b'CHILD_OF:'):
-                            continue
-
-                        parent, name = item['key'][9:].split(b':')
-
-                        path_node_key = item['value'].decode()
-                        if item['value'] == b'':
+                                normalized_backing_file_path = os.path.join(fs_type_root, backing_file_path)
+
+                            backing_file['backing_file_path'] = normalized_backing_file_path
+
+                    # Loop over the "CHILD_OF" records, this time to add to the path_nodes dict (used later to
+                    # construct the logical path for items in FileSystem. We look at deleted records here; while the
+                    # value is empty, the key still exists and has useful info in it.
+                    for item in child_of_items:
+                        # The key is "CHILD_OF:|parent_id|:<name>"; slice around the first colon after the
+                        # parent_id, as the name itself may contain colons.
+                        child_of_key = item['key']
+                        name_sep = child_of_key.index(b':', 9)
+                        parent = child_of_key[9:name_sep]
+                        name = child_of_key[name_sep + 1:]
+
+                        file_id = item['value'].decode()
+                        path_node_key = file_id
+                        if not file_id:
                             path_node_key = f"deleted-{item['seq']}"
 
-                        path_nodes[path_node_key] = {
+                        node_parents[path_node_key] = parent.decode()
+                        path_node = path_nodes[path_node_key] = {
                             'name': name.decode(),
                             'type': fs_type,
                             'origin_id': origin_id,
-                            'parent': parent.decode(),
                             'fs_path': '',
                             'modification_time': '',
                             'seq': item['seq'],
@@ -2148,36 +2488,21 @@ class Chrome(WebBrowser):
                             'children': {}
                         }
 
-                        if not item['value'] == b'':
-                            value_dict = {
-                                'fs_path': backing_files[item['value'].decode()]['backing_file_path'],
-                                'modification_time': backing_files[item['value'].decode()]['modification_time'],
-                                'file_exists': backing_files[item['value'].decode()].get('file_exists'),
-                                'file_size': backing_files[item['value'].decode()].get('file_size'),
-                                'magic_results': backing_files[item['value'].decode()].get('magic_results'),
-                            }
-                            path_nodes[path_node_key].update(value_dict)
+                        if file_id:
+                            backing_file = backing_files[file_id]
+                            path_node['fs_path'] = backing_file['backing_file_path']
+                            path_node['modification_time'] = backing_file['modification_time']
+                            path_node['file_exists'] = backing_file.get('file_exists')
+                            path_node['file_size'] = backing_file.get('file_size')
+                            path_node['magic_results'] = backing_file.get('magic_results')
 
                         result_count += 1
 
-                for entry_id in path_nodes:
-                    if path_nodes[entry_id].get('parent'):
-                        path_nodes[path_nodes[entry_id].get('parent')]['children'][entry_id] = path_nodes[entry_id]
-                    else:
-                        node_tree[entry_id] = path_nodes[entry_id]
-
-                self.build_logical_fs_path(node_tree['0'])
-                flattened_list = []
-                self.flatten_nodes_to_list(flattened_list, node_tree['0'])
+                for entry_id, parent_id in node_parents.items():
+                    if parent_id:
+                        path_nodes[parent_id]['children'][entry_id] = path_nodes[entry_id]
 
-                for item in flattened_list:
-                    result_list.append(Chrome.FileSystemItem(
-                        profile=self.profile_path, origin=item.get('origin'), key=item.get('logical_path'),
-                        value=item.get('local_path'), seq=item['seq'], state=item['state'],
-                        source_path=str(item['source_path']), last_modified=item.get('modification_time'),
-                        file_exists=item.get('file_exists'), file_size=item.get('file_size'),
-                        magic_results=item.get('magic_results')
-                    ))
+                result_list.extend(self.iter_fs_items(path_nodes['0']))
 
         log.info(f' - Parsed {len(result_list)} items')
         self.artifacts_counts['File System'] = len(result_list)
@@ -2282,50 +2607,49 @@ class Chrome(WebBrowser):
         #    trivially reveal a user's browsing history to an attacker reading the
         #    serialized state on disk.
 
-        with open(ts_file_path, encoding='utf-8', errors='replace') as f:
-            ts_json = json.loads(f.read())
+        ts_json = utils.read_json_file(ts_file_path)
 
-            # As of now (2021), there are two versions of the TransportSecurity JSON file.
-            # Version 2 has a top level "version" key (with a value of 2), and version 1
-            # has the HSTS domain hashes as top level keys.
+        # As of now (2021), there are two versions of the TransportSecurity JSON file.
+        # Version 2 has a top level "version" key (with a value of 2), and version 1
+        # has the HSTS domain hashes as top level keys.
 
-            # Version 2
-            if ts_json.get('version'):
-                assert ts_json['version'] == 2, '"2" is only supported value for "version"'
-                hsts = ts_json['sts']
+        # Version 2
+        if ts_json.get('version'):
+            assert ts_json['version'] == 2, '"2" is only supported value for "version"'
+            hsts = ts_json['sts']
 
-                for item in hsts:
-                    if item['host'] in self.hsts_hashes:
-                        hsts_domain = self.hsts_hashes[item['host']]
-                    else:
-                        hsts_domain = f'Encoded domain: {item["host"]}'
+            for item in hsts:
+                if item['host'] in self.hsts_hashes:
+                    hsts_domain = self.hsts_hashes[item['host']]
+                else:
+                    hsts_domain = f'Encoded domain: {item["host"]}'
+
+                hsts_record = Chrome.SiteSetting(
+                    self.profile_path, url=hsts_domain,
+                    timestamp=utils.to_datetime(item['sts_observed'], self.timezone),
+                    key='HSTS observed', value=str(item), interpretation='')
+                hsts_record.row_type += ' (hsts)'
+                result_list.append(hsts_record)
+
+        # Version 1
+        elif len(ts_json):
+            for hashed_domain, domain_settings in ts_json.items():
+                if hashed_domain in self.hsts_hashes:
+                    hsts_domain = self.hsts_hashes[hashed_domain]
+                else:
+                    hsts_domain = f'{hashed_domain} (encoded domain)'
 
+                if domain_settings.get('sts_observed'):
                     hsts_record = Chrome.SiteSetting(
                         self.profile_path, url=hsts_domain,
-                        timestamp=utils.to_datetime(item['sts_observed'], self.timezone),
-                        key='HSTS observed', value=str(item), interpretation='')
+                        timestamp=utils.to_datetime(domain_settings['sts_observed'], self.timezone),
+                        key='HSTS observed', value=f'{hashed_domain}: {domain_settings}', interpretation='')
                     hsts_record.row_type += ' (hsts)'
                     result_list.append(hsts_record)
 
-            # Version 1
-            elif len(ts_json):
-                for hashed_domain, domain_settings in ts_json.items():
-                    if hashed_domain in self.hsts_hashes:
-                        hsts_domain = self.hsts_hashes[hashed_domain]
-                    else:
-                        hsts_domain = f'{hashed_domain} (encoded domain)'
-
-                    if domain_settings.get('sts_observed'):
-                        hsts_record = Chrome.SiteSetting(
-                            self.profile_path, url=hsts_domain,
-                            timestamp=utils.to_datetime(domain_settings['sts_observed'], self.timezone),
-                            key='HSTS observed', value=f'{hashed_domain}: {domain_settings}', interpretation='')
-                        hsts_record.row_type += ' (hsts)'
-                        result_list.append(hsts_record)
-
-            else:
-                log.warning('Unable to process TransportSecurity file; could not determine version.')
-                return
+        else:
+            log.warning('Unable to process TransportSecurity file; could not determine version.')
+            return
 
         log.info(f' - Parsed {len(result_list)} items')
         self.artifacts_counts['HSTS'] = len(result_list)
@@ -2339,21 +2663,25 @@ class Chrome(WebBrowser):
         supported_items = supported_databases + supported_subdirs + supported_jsons
         log.debug(f'Supported items: {supported_items}')
 
+        # Additional copies of a database can be added with a '__' suffix (like 'History__work')
+        supported_database_prefixes = tuple(f'{db}__' for db in supported_databases)
+
         input_listing = os.listdir(self.profile_path)
+        # Most of the checks below are whether a particular file or directory exists; a set makes each of those one
+        # lookup, while input_listing keeps the directory order for the loops over every file.
+        input_names = set(input_listing)
         for input_file in input_listing:
             # If input_file is in our supported db list, or if the input_file name starts with a
             # value in supported_databases followed by '__' (used to add in dbs from additional sources)
-            if input_file in supported_databases or \
-                    input_file.startswith(tuple([db + '__' for db in supported_databases])):
+            if input_file in supported_databases or input_file.startswith(supported_database_prefixes):
                 # Process structure from Chrome database files
                 self.build_structure(self.profile_path, input_file)
 
         network_listing = None
-        if 'Network' in input_listing:
+        if 'Network' in input_names:
             network_listing = os.listdir(os.path.join(self.profile_path, 'Network'))
             for input_file in network_listing:
-                if input_file in supported_databases or \
-                        input_file.startswith(tuple([db + '__' for db in supported_databases])):
+                if input_file in supported_databases or input_file.startswith(supported_database_prefixes):
                     # Process structure from Chrome database files
                     self.build_structure(self.profile_path, input_file)
 
@@ -2378,11 +2706,10 @@ class Chrome(WebBrowser):
                 log.info(f' - {input_file}')
 
         # Process History files
-        custom_type_re = re.compile(r'__([A-z0-9\._]*)$')
         for input_file in input_listing:
-            if re.search(r'^History__|^History$', input_file):
+            if input_file == 'History' or input_file.startswith('History__'):
                 row_type = 'url'
-                custom_type_m = re.search(custom_type_re, input_file)
+                custom_type_m = HISTORY_CUSTOM_TYPE_RE.search(input_file)
                 if custom_type_m:
                     row_type = f'url ({custom_type_m.group(1)})'
                 self.get_history(self.profile_path, input_file, self.version, row_type)
@@ -2402,21 +2729,21 @@ class Chrome(WebBrowser):
                     self.artifacts_display[input_file + '_downloads'], 
                     self.artifacts_counts.get(input_file + '_downloads', '0')))
 
-        if 'Archived History' in input_listing:
+        if 'Archived History' in input_names:
             self.get_history(self.profile_path, 'Archived History', self.version, 'url (archived)')
             self.artifacts_display['Archived History'] = "Archived URL records"
             print(self.format_processing_output(
                 self.artifacts_display['Archived History'],
                 self.artifacts_counts.get('Archived History', '0')))
 
-        if 'IndexedDB' in input_listing:
+        if 'IndexedDB' in input_names:
             self.get_indexeddb(self.profile_path, 'IndexedDB')
             self.artifacts_display['IndexedDB'] = 'IndexedDB records'
             print(self.format_processing_output(
                 self.artifacts_display['IndexedDB'],
                 self.artifacts_counts.get('IndexedDB', '0')))
 
-        if 'Media History' in input_listing:
+        if 'Media History' in input_names:
             self.get_media_history(self.profile_path, 'Media History', self.version, 'media (playback end)')
             self.artifacts_display['Media History'] = "Media History records"
             print(self.format_processing_output(
@@ -2431,7 +2758,7 @@ class Chrome(WebBrowser):
                 self.artifacts_display['Cache'],
                 self.artifacts_counts.get('Cache', '0')))
 
-        elif 'Cache' in input_listing:
+        elif 'Cache' in input_names:
             if os.path.isdir(os.path.join(self.profile_path, 'Cache', 'Cache_Data')):
                 self.get_cache(os.path.join(self.profile_path, 'Cache'), 'Cache_Data', row_type='cache')
             else:
@@ -2440,64 +2767,64 @@ class Chrome(WebBrowser):
             print(self.format_processing_output(
                 self.artifacts_display['Cache'],
                 self.artifacts_counts.get('Cache', '0')))
-            
-        if 'GPUCache' in input_listing:
+
+        if 'GPUCache' in input_names:
             self.get_cache(self.profile_path, 'GPUCache', row_type='cache (gpu)')
             self.artifacts_display['GPUCache'] = 'GPU Cache records'
             print(self.format_processing_output(
                 self.artifacts_display['GPUCache'],
                 self.artifacts_counts.get('GPUCache', '0')))
 
-        if 'Media Cache' in input_listing:
+        if 'Media Cache' in input_names:
             self.get_cache(self.profile_path, 'Media Cache', row_type='cache (media)')
             self.artifacts_display['Media Cache'] = 'Media Cache records'
             print(self.format_processing_output(
                 self.artifacts_display['Media Cache'],
                 self.artifacts_counts.get('Media Cache', '0')))
 
-        if 'Cookies' in input_listing:
+        if 'Cookies' in input_names:
             self.get_cookies(self.profile_path, 'Cookies', self.version)
             self.artifacts_display['Cookies'] = 'Cookie records'
             print(self.format_processing_output(
                 self.artifacts_display['Cookies'],
                 self.artifacts_counts.get('Cookies', '0')))
 
-        if 'Web Data' in input_listing:
+        if 'Web Data' in input_names:
             self.get_autofill(self.profile_path, 'Web Data', self.version)
             self.artifacts_display['Autofill'] = 'Autofill records'
             print(self.format_processing_output(
                 self.artifacts_display['Autofill'],
                 self.artifacts_counts.get('Autofill', '0')))
 
-        if 'Bookmarks' in input_listing:
+        if 'Bookmarks' in input_names:
             self.get_bookmarks(self.profile_path, 'Bookmarks', self.version)
             self.artifacts_display['Bookmarks'] = 'Bookmark records'
             print(self.format_processing_output(
                 self.artifacts_display['Bookmarks'],
                 self.artifacts_counts.get('Bookmarks', '0')))
 
-        if 'Local Storage' in input_listing:
+        if 'Local Storage' in input_names:
             self.get_local_storage(self.profile_path, 'Local Storage')
             self.artifacts_display['Local Storage'] = 'Local Storage records'
             print(self.format_processing_output(
                 self.artifacts_display['Local Storage'],
                 self.artifacts_counts.get('Local Storage', '0')))
 
-        if 'Session Storage' in input_listing:
+        if 'Session Storage' in input_names:
             self.get_session_storage(self.profile_path, 'Session Storage')
             self.artifacts_display['Session Storage'] = 'Session Storage records'
             print(self.format_processing_output(
                 self.artifacts_display['Session Storage'],
                 self.artifacts_counts.get('Session Storage', '0')))
 
-        if 'Extensions' in input_listing:
+        if 'Extensions' in input_names:
             self.get_extensions(self.profile_path, 'Extensions')
             self.artifacts_display['Extensions'] = 'Extensions'
             print(self.format_processing_output(
                 self.artifacts_display['Extensions'],
                 self.artifacts_counts.get('Extensions', '0')))
 
-        if 'Extension Cookies' in input_listing:
+        if 'Extension Cookies' in input_names:
             # Workaround to cap the version at 65 for Extension Cookies, as until that
             # point it has the same database format as Cookies
             # TODO: Need to revisit this, as in v69 the structures are the same again, but
@@ -2512,42 +2839,42 @@ class Chrome(WebBrowser):
                 self.artifacts_display['Extension Cookies'],
                 self.artifacts_counts.get('Extension Cookies', '0')))
 
-        if 'Login Data' in input_listing:
+        if 'Login Data' in input_names:
             self.get_login_data(self.profile_path, 'Login Data', self.version)
             self.artifacts_display['Login Data'] = 'Login Data records'
             print(self.format_processing_output(
                 self.artifacts_display['Login Data'],
                 self.artifacts_counts.get('Login Data', '0')))
 
-        if 'Preferences' in input_listing:
+        if 'Preferences' in input_names:
             self.get_preferences(self.profile_path, 'Preferences')
             self.artifacts_display['Preferences'] = 'Preference Items'
             print(self.format_processing_output(
                 self.artifacts_display['Preferences'],
                 self.artifacts_counts.get('Preferences', '0')))
 
-        if 'Site Characteristics Database' in input_listing:
+        if 'Site Characteristics Database' in input_names:
             self.get_site_characteristics(self.profile_path, 'Site Characteristics Database')
             self.artifacts_display['Site Characteristics'] = "Site Characteristics records"
             print(self.format_processing_output(
                 self.artifacts_display['Site Characteristics'],
                 self.artifacts_counts.get('Site Characteristics', '0')))
 
-        if 'TransportSecurity' in input_listing:
+        if 'TransportSecurity' in input_names:
             self.get_transport_security(self.profile_path, 'TransportSecurity')
             self.artifacts_display['HSTS'] = "HSTS records"
             print(self.format_processing_output(
                 self.artifacts_display['HSTS'],
                 self.artifacts_counts.get('HSTS', '0')))
 
-        if 'File System' in input_listing:
+        if 'File System' in input_names:
             self.get_file_system(self.profile_path, 'File System')
             self.artifacts_display['File System'] = 'File System Items'
             print(self.format_processing_output(
                 self.artifacts_display['File System'],
                 self.artifacts_counts.get('File System', '0')))
 
-        if 'DIPS' in input_listing:
+        if 'DIPS' in input_names:
             self.get_dips_popups(self.profile_path, 'DIPS', self.version)
             self.artifacts_display['DIPS Popups'] = 'DIPS Popup Items'
             print(self.format_processing_output(
@@ -2579,8 +2906,8 @@ class Chrome(WebBrowser):
         # have a cardiac arrest on the non-unicode binary data.
         self.cached_key = None
 
-        self.parsed_artifacts.sort()
-        self.parsed_storage.sort()
+        self.parsed_artifacts = self.sorted_history_items(self.parsed_artifacts)
+        self.parsed_storage.sort(key=operator.attrgetter('origin'))
 
         # Clean temp directory after processing profile
         if not self.no_copy:
@@ -2603,113 +2930,32 @@ class Chrome(WebBrowser):
                 transition_friendly=transition_friendly)
 
         def decode_transition(self):
-            # Source: http://src.chromium.org/svn/trunk/src/content/public/common/page_transition_types_list.h
-            transition_friendly = {
-                0: 'link',                 # User got to this page by clicking a link on another page.
-                1: 'typed',                # User got this page by typing the URL in the URL bar.  This should not be
-                                           #  used for cases where the user selected a choice that didn't look at all
-                                           #  like a URL; see GENERATED below.
-                                           # We also use this for other 'explicit' navigation actions.
-                2: 'auto bookmark',        # User got to this page through a suggestion in the UI, for example)
-                                           #  through the destinations page.
-                3: 'auto subframe',        # This is a subframe navigation. This is any content that is automatically
-                                           #  loaded in a non-toplevel frame. For example, if a page consists of
-                                           #  several frames containing ads, those ad URLs will have this transition
-                                           #  type. The user may not even realize the content in these pages is a
-                                           #  separate frame, so may not care about the URL (see MANUAL below).
-                4: 'manual subframe',      # For subframe navigations that are explicitly requested by the user and
-                                           #  generate new navigation entries in the back/forward list. These are
-                                           #  probably more important than frames that were automatically loaded in
-                                           #  the background because the user probably cares about the fact that this
-                                           #  link was loaded.
-                5: 'generated',            # User got to this page by typing in the URL bar and selecting an entry
-                                           #  that did not look like a URL.  For example, a match might have the URL
-                                           #  of a Google search result page, but appear like 'Search Google for ...'.
-                                           #  These are not quite the same as TYPED navigations because the user
-                                           #  didn't type or see the destination URL.
-                                           #  See also KEYWORD.
-                6: 'start page',           # This is a toplevel navigation. This is any content that is automatically
-                                           #  loaded in a toplevel frame.  For example, opening a tab to show the ASH
-                                           #  screen saver, opening the devtools window, opening the NTP after the safe
-                                           #  browsing warning, opening web-based dialog boxes are examples of
-                                           #  AUTO_TOPLEVEL navigations.
-                7: 'form submit',          # The user filled out values in a form and submitted it. NOTE that in
-                                           #  some situations submitting a form does not result in this transition
-                                           #  type. This can happen if the form uses script to submit the contents.
-                8: 'reload',               # The user 'reloaded' the page, either by hitting the reload button or by
-                                           #  hitting enter in the address bar.  NOTE: This is distinct from the
-                                           #  concept of whether a particular load uses 'reload semantics' (i.e.
-                                           #  bypasses cached data).  For this reason, lots of code needs to pass
-                                           #  around the concept of whether a load should be treated as a 'reload'
-                                           #  separately from their tracking of this transition type, which is mainly
-                                           #  used for proper scoring for consumers who care about how frequently a
-                                           #  user typed/visited a particular URL.
-                                           #  SessionRestore and undo tab close use this transition type too.
-                9: 'keyword',              # The url was generated from a replaceable keyword other than the default
-                                           #  search provider. If the user types a keyword (which also applies to
-                                           #  tab-to-search) in the omnibox this qualifier is applied to the transition
-                                           #  type of the generated url. TemplateURLModel then may generate an
-                                           #  additional visit with a transition type of KEYWORD_GENERATED against the
-                                           #  url 'http://' + keyword. For example, if you do a tab-to-search against
-                                           #  wikipedia the generated url has a transition qualifer of KEYWORD, and
-                                           #  TemplateURLModel generates a visit for 'wikipedia.org' with a transition
-                                           #  type of KEYWORD_GENERATED.
-                10: 'keyword generated'    # Corresponds to a visit generated for a keyword. See description of
-                                           #  KEYWORD for more details.
-            }
-
-            qualifiers_friendly = {
-                0x00800000: 'Blocked',                # A managed user attempted to visit a URL but was blocked.
-                0x01000000: 'Forward or Back',        # User used the Forward or Back button to navigate among browsing
-                                                      #  history.
-                0x02000000: 'From Address Bar',       # User used the address bar to trigger this navigation.
-                0x04000000: 'Home Page',              # User is navigating to the home page.
-                0x08000000: 'From API',               # The transition originated from an external application; the
-                                                      #  exact definition of this is embedder dependent.
-                0x10000000: 'Navigation Chain Start', # The beginning of a navigation chain.
-                0x20000000: 'Navigation Chain End',   # The last transition in a redirect chain.
-                0x40000000: 'Client Redirect',        # Redirects caused by JavaScript or a meta refresh tag on the page
-                0x80000000: 'Server Redirect'         # Redirects sent from the server by HTTP headers. It might be nice
-                                                      #  to break this out into 2 types in the future, permanent or
-                                                      #  temporary, if we can get that information from WebKit.
-                }
-
             raw = self.transition
             # If the transition has already been translated to a string, just use that
             if isinstance(raw, str):
                 self.transition_friendly = raw
                 return
 
-            core_mask = 0xff
-            code = raw & core_mask
+            transition_friendly = self.transition_to_friendly(raw)
+            if transition_friendly:
+                self.transition_friendly = transition_friendly
 
-            if code in list(transition_friendly.keys()):
-                self.transition_friendly = transition_friendly[code] + '; '
+        @staticmethod
+        @functools.lru_cache(maxsize=None)
+        def transition_to_friendly(raw):
+            """Translate a raw transition value into its human-readable form. History files have relatively few
+            distinct transition values spread across many visits, so results are cached per value."""
+            code = raw & 0xff
+            friendly = ''
 
-            for qualifier in qualifiers_friendly:
-                if raw & qualifier == qualifier:
-                    if not self.transition_friendly:
-                        self.transition_friendly = ""
-                    self.transition_friendly += qualifiers_friendly[qualifier] + '; '
+            if code in PAGE_TRANSITION_TYPES:
+                friendly = PAGE_TRANSITION_TYPES[code] + '; '
 
-        def decode_source(self):
-            # https://source.chromium.org/chromium/chromium/src/+/master:components/history/core/browser/history_types.h
-            source_friendly = {
-                0:    'Synced',               # Synchronized from somewhere else.
-                1:    'Local',                # User browsed. In my experience, this value isn't written; it will be
-                                              # null. See https://cs.chromium.org/chromium/src/components/history/
-                None: 'Local',                #  core/browser/visit_database.cc
-                2:    'Added by Extension',   # Added by an extension.
-                3:    'Firefox (Imported)',
-                4:    'IE (Imported)',
-                5:    'Safari (Imported)',
-                6:    'Chrome/Edge (Imported)',                
-                7:    'EdgeHTML (Imported)'}
+            return friendly + PAGE_TRANSITION_QUALIFIER_TEXTS[(raw >> PAGE_TRANSITION_QUALIFIERS_SHIFT) & 0x1ff]
 
+        def decode_source(self):
             raw = self.visit_source
-
-            if raw in list(source_friendly.keys()):
-                self.visit_source = source_friendly[raw]
+            self.visit_source = VISIT_SOURCES.get(raw, raw)
 
     class DownloadItem(WebBrowser.DownloadItem):
         def __init__(
@@ -2726,58 +2972,8 @@ class Chrome(WebBrowser):
                 state_friendly=state_friendly, status_friendly=status_friendly)
 
         def decode_interrupt_reason(self):
-            interrupts = {
-                0:  'No Interrupt',                # Success
-
-                # from download_interrupt_reason_values.h on Chromium site
-                # File errors
-                1:  'File Error',                  # Generic file operation failure.
-                2:  'Access Denied',               # The file cannot be accessed due to security restrictions.
-                3:  'Disk Full',                   # There is not enough room on the drive.
-                5:  'Path Too Long',               # The directory or file name is too long.
-                6:  'File Too Large',              # The file is too large for the file system to handle.
-                7:  'Virus',                       # The file contains a virus.
-                10: 'Temporary Problem',           # The file was in use. Too many files are opened at once. We have run
-                                                   #  out of memory.
-                11: 'Blocked',                     # The file was blocked due to local policy.
-                12: 'Security Check Failed',       # An attempt to check the safety of the download failed due to
-                                                   #  unexpected reasons. See http://crbug.com/153212.
-                13: 'Resume Error',                # An attempt was made to seek past the end of a file in opening a
-                                                   #  file (as part of resuming a previously interrupted download).
-
-                # Network errors
-                20: 'Network Error',               # Generic network failure.
-                21: 'Operation Timed Out',         # The network operation timed out.
-                22: 'Connection Lost',             # The network connection has been lost.
-                23: 'Server Down',                 # The server has gone down.
-
-                # Server responses
-                30: 'Server Error',                # The server indicates that the operation has failed (generic).
-                31: 'Range Request Error',         # The server does not support range requests.
-                32: 'Server Precondition Error',   # The download request does not meet the specified precondition.
-                                                   #  Internal use only:  the file has changed on the server.
-                33: 'Unable to get file',          # The server does not have the requested data.
-                34: 'Server Unauthorized',         # Server didn't authorize access to resource.
-                35: 'Server Certificate Problem',  # Server certificate problem.
-                36: 'Server Access Forbidden',     # Server access forbidden.
-                37: 'Server Unreachable',          # Unexpected server response. This might indicate that the responding
-                                                   #  server may not be the intended server.
-                38: 'Content Length Mismatch',     # The server sent fewer bytes than the content-length header. It may
-                                                   #  indicate that the connection was closed prematurely, or the
-                                                   #  Content-Length header was invalid. The download is only
-                                                   #  interrupted if strong validators are present. Otherwise, it is
-                                                   #  treated as finished.
-                39: 'Cross Origin Redirect',       # An unexpected cross-origin redirect happened.
-
-                # User input
-                40: 'Cancelled',                   # The user cancelled the download.
-                41: 'Browser Shutdown',            # The user shut down the browser.
-
-                # Crash
-                50: 'Browser Crashed'}             # The browser crashed.
-
-            if self.interrupt_reason in list(interrupts.keys()):
-                self.interrupt_reason_friendly = interrupts[self.interrupt_reason]
+            if self.interrupt_reason in DOWNLOAD_INTERRUPT_REASONS:
+                self.interrupt_reason_friendly = DOWNLOAD_INTERRUPT_REASONS[self.interrupt_reason]
             elif self.interrupt_reason is None:
                 self.interrupt_reason_friendly = None
             else:
@@ -2785,48 +2981,8 @@ class Chrome(WebBrowser):
                 log.error(f' - Error decoding interrupt code for download "{self.url}"')
 
         def decode_danger_type(self):
-            # from download_danger_type.h on Chromium site
-            dangers = {
-                0: 'Not Dangerous',                 # The download is safe.
-                1: 'Dangerous',                     # A dangerous file to the system (eg: a pdf or extension from places
-                                                    #  other than gallery).
-                2: 'Dangerous URL',                 # Safe Browsing download service shows this URL leads to malicious
-                                                    #  file download.
-                3: 'Dangerous Content',             # SafeBrowsing download service shows this file content as being
-                                                    #  malicious.
-                4: 'Content May Be Malicious',      # The content of this download may be malicious (eg: extension is
-                                                    #  exe but Safe Browsing has not finished checking the content).
-                5: 'Uncommon Content',              # Safe Browsing download service checked the contents of the
-                                                    #  download, but didn't have enough data to determine whether 
-                                                    #  it was malicious.
-                6: 'Dangerous But User Validated',  # The download was evaluated to be one of the other types of danger,
-                                                    #  but the user told us to go ahead anyway.
-                7: 'Dangerous Host',                # Safe Browsing download service checked the contents of the
-                                                    #  download and didn't have data on this specific file, 
-                                                    #  but the file was served
-                                                    #  from a host known to serve mostly malicious content.
-                8: 'Potentially Unwanted',          # Applications and extensions that modify browser and/or computer
-                                                    #  settings
-                9: 'Allowlisted by Policy',         # Download URL allowed by enterprise policy.
-                10: 'Pending Scan',                 # Download is pending a more detailed verdict.
-                11: 'Blocked - Password Protected', # Download is password protected, and should be blocked according
-                                                    #  to policy.
-                12: 'Blocked - Too Large',          # Download is too large, and should be blocked according to policy.
-                13: 'Warning - Sensitive Content',  # Download deep scanning identified sensitive content, and
-                                                    #  recommended warning the user.
-                14: 'Blocked - Sensitive Content',  # Download deep scanning identified sensitive content, and
-                                                    #  recommended blocking the file.
-                15: 'Safe - Deep Scanned',          # Download deep scanning identified no problems.
-                16: 'Dangerous, but user opened',   # Download deep scanning identified a problem, but the file has
-                                                    #  already been opened by the user.
-                17: 'Prompt for Scanning',          # The user is enrolled in the Advanced Protection Program, and
-                                                    #  the server has recommended this file be deep scanned.
-                18: 'Blocked - Unsupported Type'   # The download has a file type that is unsupported for deep
-                                                    #  scanning, and should be blocked according to policy.
-            }
-
-            if self.danger_type in list(dangers.keys()):
-                self.danger_type_friendly = dangers[self.danger_type]
+            if self.danger_type in DOWNLOAD_DANGER_TYPES:
+                self.danger_type_friendly = DOWNLOAD_DANGER_TYPES[self.danger_type]
             elif self.danger_type is None:
                 self.danger_type_friendly = None
             else:
@@ -2834,28 +2990,23 @@ class Chrome(WebBrowser):
                 log.error(f' - Error decoding danger code for download "{self.url}"')
 
         def decode_download_state(self):
-            # from download_item.h on Chromium site
-            states = {
-                0: 'In Progress',   # Download is actively progressing.
-                1: 'Complete',      # Download is completely finished.
-                2: 'Cancelled',     # Download has been cancelled.
-                3: 'Interrupted',   # '3' was the old 'Interrupted' code until a bugfix in Chrome v22. 22+ it's '4'
-                4: 'Interrupted'}   # This state indicates that the download has been interrupted.
-
-            if self.state in list(states.keys()):
-                self.state_friendly = states[self.state]
+            if self.state in DOWNLOAD_STATES:
+                self.state_friendly = DOWNLOAD_STATES[self.state]
             else:
                 self.state_friendly = '[Error - Unknown State]'
                 log.error(f' - Error decoding download state for download "{self.url}"')
 
         def create_friendly_status(self):
             try:
-                status = "%s -  %i%% [%i/%i]" % \
-                         (self.state_friendly, (float(self.received_bytes) / float(self.total_bytes)) * 100,
-                          self.received_bytes, self.total_bytes)
-            except ZeroDivisionError:
-                status = "%s -  %i bytes" % (self.state_friendly, self.received_bytes)
-            except:
+                if self.total_bytes == 0:
+                    template = "%s -  %i bytes"
+                    fields = (self.state_friendly, self.received_bytes)
+                else:
+                    template = "%s -  %i%% [%i/%i]"
+                    fields = (self.state_friendly, self.received_bytes * 100 // self.total_bytes,
+                              self.received_bytes, self.total_bytes)
+                status = template % fields
+            except (TypeError, ValueError, ZeroDivisionError):
                 status = "[parsing error]"
                 log.error(" - Error creating friendly status message for download '{}'".format(self.url))
             self.status_friendly = status
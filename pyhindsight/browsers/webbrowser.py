@@ -1,6 +1,7 @@
 import abc
 import hashlib
 import logging
+import operator
 import sqlite3
 import sys
 import urllib.parse
@@ -82,7 +83,7 @@ class WebBrowser(object):
             # Find the names of each table in the db
             try:
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                tables = cursor.fetchall()
+                table_names = [row['name'] for row in cursor.fetchall()]
             except sqlite3.OperationalError:
                 print("\nSQLite3 error; is the Chrome profile in use?  Hindsight cannot access history files "
                       "if Chrome has them locked.  This error most often occurs when trying to analyze a local "
@@ -92,17 +93,28 @@ class WebBrowser(object):
                 log.error(f' - Could not query {database} in {path}')
                 return
 
-            # For each table, find all the columns in it
-            for table in tables:
-                # cursor.execute('PRAGMA table_info({})'.format(str(table[0])))
-                cursor.execute('PRAGMA table_info({})'.format(table['name']))
-                columns = cursor.fetchall()
-
-                # Create a dict of lists of the table/column names
-                # self.structure[database][str(table[0])] = []
-                self.structure[database][table['name']] = []
-                for column in columns:
-                    self.structure[database][table['name']].append(column['name'])
+            # Find all the columns in each table, in a single query if possible
+            tables = {}
+            try:
+                cursor.execute("SELECT m.name AS table_name, p.name AS column_name "
+                               "FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS p "
+                               "WHERE m.type='table'")
+                for column in cursor.fetchall():
+                    tables.setdefault(column['table_name'], []).append(column['column_name'])
+            except sqlite3.Error as e:
+                log.warning(f' - Could not read columns of all tables in {database} at once ({e}); '
+                            f'falling back to one table at a time')
+                tables = {}
+                for table_name in table_names:
+                    try:
+                        cursor.execute('PRAGMA table_info("{}")'.format(table_name.replace('"', '""')))
+                        tables[table_name] = [column['name'] for column in cursor.fetchall()]
+                    except sqlite3.Error as e:
+                        log.error(f' - Could not read columns of table {table_name} in {database}: {e}')
+
+            # Store a frozenset of the column names for each table
+            for table_name, column_names in tables.items():
+                self.structure[database][table_name] = frozenset(column_names)
 
     @staticmethod
     def dict_factory(cursor, row):
@@ -149,6 +161,23 @@ class WebBrowser(object):
                     hostnames.add(hostname)
         return hostnames
 
+    @staticmethod
+    def sorted_history_items(history_items):
+        """Return history_items sorted by timestamp.
+
+        Sorting with the timestamps as keys is much faster than comparing items pairwise with HistoryItem.__lt__.
+        Naive and timezone-aware timestamps can't be compared, though, so first do what __lt__ would have done and
+        give any naive timestamps the tzinfo of the aware ones."""
+
+        tzinfo = next((item.timestamp.tzinfo for item in history_items if item.timestamp.tzinfo), None)
+        if tzinfo:
+            for item in history_items:
+                if not item.timestamp.tzinfo:
+                    log.warning(f'{item} missing tzinfo; using tzinfo {tzinfo} during sort')
+                    item.timestamp = item.timestamp.replace(tzinfo=tzinfo)
+
+        return sorted(history_items, key=operator.attrgetter('timestamp'))
+
     def build_md5_hash_list_of_origins(self):
         domains = self.get_clean_hostnames()
         for domain in domains:
@@ -227,11 +256,8 @@ class WebBrowser(object):
             return f"{(self.metadata.get_attribute('content-type') or ['not specified'])[0]} ({len(self.data)} bytes)"
 
         def stringify_http_headers(self):
-            headers = {}
-            for attribute, value in self.metadata.http_header_attributes:
-                headers[attribute] = value
-
-            self.http_headers_str = str(headers)
+            # Later duplicates of a header replace earlier ones, as they would assigning the pairs one at a time
+            self.http_headers_str = str(dict(self.metadata.http_header_attributes))
 
     class DownloadItem(HistoryItem):
         def __init__(
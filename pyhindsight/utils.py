@@ -1,3 +1,4 @@
+import bisect
 import datetime
 import json
 import logging
@@ -8,6 +9,12 @@ import struct
 from pyhindsight import __version__
 from pathlib import Path
 
+# orjson is optional; it's much faster than the json module when decoding large files like Bookmarks
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 
 
@@ -55,6 +62,16 @@ def open_sqlite_db(chrome, database_path, database_name):
         db_conn.row_factory = dict_factory
         db_conn.text_factory = text_factory
 
+        # Read tuning for this connection only; unlike journal_mode, none of these change the database file,
+        # so they are safe to use when reading the original (no_copy) databases.
+        db_conn.execute('PRAGMA temp_store = MEMORY')
+        db_conn.execute('PRAGMA cache_size = -20000')
+
+        # Only memory-map our own temp copy; the original may belong to a running browser, and if it is
+        # truncated while mapped the process is killed with SIGBUS.
+        if not chrome.no_copy:
+            db_conn.execute('PRAGMA mmap_size = 268435456')
+
         # Execute a test query to make sure the database is not corrupted
         db_conn.execute("SELECT name FROM sqlite_schema WHERE type='table'")
 
@@ -90,6 +107,24 @@ class MyEncoder(json.JSONEncoder):
             return obj.__dict__
 
 
+def read_json_file(file_path):
+    """Read and decode the JSON file at the given path.
+
+    Uses orjson if it is installed. orjson is strict about its input (invalid UTF-8, NaN, etc.), so
+    anything it rejects is decoded with the json module instead, replacing any invalid UTF-8."""
+
+    with open(file_path, 'rb') as f:
+        raw_json = f.read()
+
+    if orjson is not None:
+        try:
+            return orjson.loads(raw_json)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(raw_json.decode('utf-8', errors='replace'))
+
+
 def to_datetime(timestamp, timezone=None):
     """Convert a variety of timestamp formats to a datetime object."""
 
@@ -149,6 +184,17 @@ def to_datetime(timestamp, timezone=None):
         return datetime.datetime.fromtimestamp(0, datetime.UTC)
 
 
+def get_compatible_version(query, version):
+    """Return the highest version key in 'query' that is <= 'version', or 0 if there isn't one.
+
+    Query dicts are keyed by the earliest Chrome version each query applies to, so this finds the
+    query to use for a given version with a binary search rather than counting down one at a time."""
+
+    query_versions = sorted(query)
+    idx = bisect.bisect_right(query_versions, version) - 1
+    return query_versions[idx] if idx >= 0 else 0
+
+
 def friendly_date(timestamp):
     if isinstance(timestamp, (str, int)):
         return to_datetime(timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
@@ -158,15 +204,15 @@ def friendly_date(timestamp):
         return timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
 
 
-def get_ldb_records(ldb_path, prefix=''):
-    """Open a LevelDB at given path and return a list of records, optionally
+def iter_ldb_records(ldb_path, prefix=''):
+    """Open a LevelDB at given path and yield its records one at a time, optionally
     filtered by a prefix string. Key and value are kept as byte strings."""
 
     try:
         from ccl_chromium_reader.storage_formats import ccl_leveldb
     except ImportError:
         log.warning(f' - Failed to import ccl_leveldb; unable to process {ldb_path}')
-        return []
+        return
 
     # The ldb key and value are both bytearrays, so the prefix must be too. We allow
     # passing the prefix into this function as a string for convenience.
@@ -177,9 +223,7 @@ def get_ldb_records(ldb_path, prefix=''):
         db = ccl_leveldb.RawLevelDb(ldb_path)
     except Exception as e:
         log.warning(f' - Could not open {ldb_path} as LevelDB; {e}')
-        return []
-
-    cleaned_records = []
+        return
 
     try:
         for record in db.iterate_records_raw():
@@ -193,7 +237,7 @@ def get_ldb_records(ldb_path, prefix=''):
                 cleaned_record['state'] = cleaned_record['state'].name
                 cleaned_record['file_type'] = cleaned_record['file_type'].name
 
-                cleaned_records.append(cleaned_record)
+                yield cleaned_record
 
     except ValueError:
         log.warning(' - Exception reading LevelDB: ValueError')
@@ -201,38 +245,54 @@ def get_ldb_records(ldb_path, prefix=''):
     except Exception as e:
         log.warning(f' - Exception reading LevelDB: {e}')
 
-    db.close()
-    return cleaned_records
+    finally:
+        db.close()
 
 
-def read_varint(source):
+def get_ldb_records(ldb_path, prefix=''):
+    """Open a LevelDB at given path and return a list of records, optionally
+    filtered by a prefix string. Key and value are kept as byte strings."""
+
+    return list(iter_ldb_records(ldb_path, prefix))
+
+
+def read_varint(source, ptr=0):
+    """Read a varint starting at 'ptr' in source. A memoryview is used so reading from
+    an offset doesn't first copy the rest of the buffer into a new bytes object."""
+
     result = 0
     bytes_used = 0
-    for read in source:
+    for read in memoryview(source)[ptr:]:
         result |= ((read & 0x7F) << (bytes_used * 7))
         bytes_used += 1
         if (read & 0x80) != 0x80:
             return result, bytes_used
 
 
+# Pre-compiled formats for the fixed-size little-endian values read below; unpack_from reads
+# them in place, without slicing a new bytes object out of the input first.
+INT32_STRUCT = struct.Struct('<i')
+UINT64_STRUCT = struct.Struct('<Q')
+
+
 def read_string(input_bytes, ptr):
-    length = struct.unpack('<i', input_bytes[ptr:ptr+4])[0]
+    length = INT32_STRUCT.unpack_from(input_bytes, ptr)[0]
     ptr += 4
     end_ptr = ptr+length
     string_value = input_bytes[ptr:end_ptr]
-    while end_ptr % 4 != 0:
-        end_ptr += 1
+    # Strings are padded out to a multiple of 4 bytes
+    end_ptr += -end_ptr % 4
 
     return string_value.decode(), end_ptr
 
 
 def read_int32(input_bytes, ptr):
-    value = struct.unpack('<i', input_bytes[ptr:ptr + 4])[0]
+    value = INT32_STRUCT.unpack_from(input_bytes, ptr)[0]
     return value, ptr + 4
 
 
 def read_int64(input_bytes, ptr):
-    value = struct.unpack('<Q', input_bytes[ptr:ptr + 8])[0]
+    value = UINT64_STRUCT.unpack_from(input_bytes, ptr)[0]
     return value, ptr + 8
 
 
@@ -0,0 +1,39 @@
+import os
+import unittest
+from Cryptodome.Cipher import AES
+from Cryptodome.Protocol.KDF import PBKDF2
+from pyhindsight.browsers.chrome import Chrome
+
+
+def encrypt_linux(plaintext, padding=None):
+    # Encrypt the way Chromium's os_crypt does on Linux without a keyring: AES-128-CBC with a key derived
+    # from 'peanuts', PKCS#7 padding, and a 'v10' prefix
+    key = PBKDF2('peanuts', b'saltysalt', 16, 1)
+    if padding is None:
+        pad_length = 16 - len(plaintext) % 16
+        padding = bytes([pad_length]) * pad_length
+    cipher = AES.new(key, AES.MODE_CBC, IV=b' ' * 16)
+    return b'v10' + cipher.encrypt(plaintext + padding)
+
+
+class TestDecryptLinux(unittest.TestCase):
+
+    def setUp(self):
+        self.test_instance = Chrome(os.path.join('tests', 'fixtures', 'profiles', '60'), version=[60], no_copy=True,
+                                    available_decrypts={'windows': 0, 'mac': 0, 'linux': 1})
+
+    def test_decrypt_linux(self):
+        test_config = [b'session_id_value', b'a', b'']
+
+        for plaintext in test_config:
+            with self.subTest(plaintext):
+                self.assertEqual(self.test_instance.decrypt_linux(encrypt_linux(plaintext)), plaintext)
+
+    def test_decrypt_linux_bad_padding(self):
+        # A last byte outside 1-16 isn't valid padding (as with the wrong key), so the value stays encrypted
+        encrypted = encrypt_linux(b'fifteen bytes..', padding=b'\x00')
+        self.assertEqual(self.test_instance.decrypt_linux(encrypted), '<encrypted>')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -40,5 +40,29 @@ class TestGetDownloads(unittest.TestCase):
                                'C:\\Users\\IEUser\\Downloads\\Hard_disk.jpg'])
 
 
+class TestCreateFriendlyStatus(unittest.TestCase):
+
+    def test_create_friendly_status(self):
+
+        test_config = [
+            {'received_bytes': 29, 'total_bytes': 100, 'status': 'Complete -  29% [29/100]'},
+            {'received_bytes': 57, 'total_bytes': 100, 'status': 'Complete -  57% [57/100]'},
+            {'received_bytes': 87, 'total_bytes': 150, 'status': 'Complete -  58% [87/150]'},
+            {'received_bytes': 50, 'total_bytes': 0, 'status': 'Complete -  50 bytes'},
+            {'received_bytes': None, 'total_bytes': 100, 'status': '[parsing error]'},
+            {'received_bytes': '50', 'total_bytes': 100, 'status': '[parsing error]'},
+            {'received_bytes': 50, 'total_bytes': None, 'status': '[parsing error]'},
+            {'received_bytes': None, 'total_bytes': 0, 'status': '[parsing error]'},
+        ]
+
+        for config in test_config:
+            with self.subTest(config):
+                download = Chrome.DownloadItem(
+                    'Default', 1, 'https://example.com/file.zip', config['received_bytes'], config['total_bytes'], 1,
+                    state_friendly='Complete')
+                download.create_friendly_status()
+                self.assertEqual(download.status_friendly, config['status'])
+
+
 if __name__ == '__main__':
     unittest.main()
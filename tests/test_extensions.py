@@ -0,0 +1,48 @@
+import unittest
+from pyhindsight.browsers.chrome import Chrome, extension_version_key
+
+
+class TestGetExtensionMessage(unittest.TestCase):
+
+    def test_get_extension_message(self):
+
+        locale_messages = {
+            'appName': {'message': 'Exact Name'},
+            'appdesc': {'message': 'Lowercase Description'},
+            'app_name': {'message': 'Fallback Name'},
+        }
+
+        test_config = [
+            {'message_name': 'appName', 'fallback': 'app_name', 'expected': 'Exact Name'},
+            {'message_name': 'appDesc', 'fallback': 'app_description', 'expected': 'Lowercase Description'},
+            {'message_name': 'missing', 'fallback': 'app_name', 'expected': 'Fallback Name'},
+            {'message_name': 'missing', 'fallback': 'app_description', 'expected': None},
+        ]
+
+        for config in test_config:
+            with self.subTest(config):
+                self.assertEqual(
+                    Chrome.get_extension_message(locale_messages, config['message_name'], config['fallback']),
+                    config['expected'])
+
+    def test_get_extension_message_no_messages(self):
+        # messages.json wasn't read (or didn't decode to a dict)
+        self.assertIsNone(Chrome.get_extension_message(None, 'appName', 'app_name'))
+
+
+class TestExtensionVersionKey(unittest.TestCase):
+
+    def test_extension_version_key(self):
+        # Each part is compared as a number, not as a string
+        self.assertGreater(extension_version_key('1.10.2_0'), extension_version_key('1.9.9_0'))
+        self.assertGreater(extension_version_key('2.0_1'), extension_version_key('2.0_0'))
+
+    def test_latest_version_selected(self):
+        # Non-numeric directories (like those left by an interrupted update) sort after every version
+        version_dirs = ['1.9.9_0', 'Temp', '1.10.2_0', '1.2_0']
+        self.assertEqual(sorted(version_dirs, reverse=True, key=extension_version_key),
+                         ['1.10.2_0', '1.9.9_0', '1.2_0', 'Temp'])
+
+
+if __name__ == '__main__':
+    unittest.main()
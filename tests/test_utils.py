@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+import unittest
+from pyhindsight import utils
+from pyhindsight.browsers import chrome
+
+
+def countdown_compatible_version(query, version):
+    # The lookup get_compatible_version replaced; decrement the version until it finds a matching query
+    compatible_version = version
+    while compatible_version not in list(query.keys()) and compatible_version > 0:
+        compatible_version -= 1
+    return compatible_version
+
+
+class TestGetCompatibleVersion(unittest.TestCase):
+
+    def test_get_compatible_version(self):
+
+        query = {59: 'q59', 30: 'q30', 7: 'q7', 1: 'q1'}
+
+        test_config = [
+            {'version': 30, 'expected': 30},   # exact
+            {'version': 45, 'expected': 30},   # between keys
+            {'version': 0, 'expected': 0},     # below minimum
+            {'version': 120, 'expected': 59},  # above maximum
+        ]
+
+        for config in test_config:
+            with self.subTest(config):
+                self.assertEqual(utils.get_compatible_version(query, config['version']), config['expected'])
+                self.assertEqual(utils.get_compatible_version(query, config['version']),
+                                 countdown_compatible_version(query, config['version']))
+
+    def test_matches_countdown(self):
+
+        queries = [chrome.HISTORY_QUERIES, chrome.MEDIA_HISTORY_QUERIES, chrome.DOWNLOAD_QUERIES,
+                   chrome.COOKIE_QUERIES, {5: 'q5'}]
+
+        for query in queries:
+            for version in range(0, 150):
+                with self.subTest(query=sorted(query), version=version):
+                    self.assertEqual(utils.get_compatible_version(query, version),
+                                     countdown_compatible_version(query, version))
+
+
+class TestReadJsonFile(unittest.TestCase):
+
+    def read_json_bytes(self, raw_json):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'test.json')
+            with open(file_path, 'wb') as f:
+                f.write(raw_json)
+            return utils.read_json_file(file_path)
+
+    def test_read_json_file(self):
+        self.assertEqual(self.read_json_bytes(b'{"name": "Hindsight", "version": [1, 2]}'),
+                         {'name': 'Hindsight', 'version': [1, 2]})
+
+    def test_invalid_utf8(self):
+        # Invalid UTF-8 is replaced rather than failing the whole file
+        self.assertEqual(self.read_json_bytes(b'{"name": "bad \xff byte"}'), {'name': 'bad � byte'})
+
+    def test_nan(self):
+        # orjson rejects NaN, but the json module accepts it
+        decoded = self.read_json_bytes(b'{"zoom": NaN, "name": "ok"}')
+        self.assertEqual(decoded['name'], 'ok')
+        self.assertNotEqual(decoded['zoom'], decoded['zoom'])
+
+    def test_invalid_json(self):
+        with self.assertRaises(json.JSONDecodeError):
+            self.read_json_bytes(b'{"name": ')
+
+
+if __name__ == '__main__':
+    unittest.main()